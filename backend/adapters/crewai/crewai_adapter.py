@@ -4,33 +4,60 @@ import asyncio
 import logging
 import json
 import importlib
+import importlib.util
 import inspect
-from datetime import datetime
+import sys
+from types import MappingProxyType
 
-from ...adapters.interfaces.base_adapter import FrameworkAdapter
+from ...adapters.interfaces.base_adapter import FrameworkAdapter, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Model providers CrewAI works with out of the box
+CREWAI_SUPPORTED_PROVIDERS = frozenset({"openai", "anthropic"})
+
+# Feature flags shared by all adapter instances (read-only)
+CREWAI_FEATURES = MappingProxyType({
+    "multi_agent": True,
+    "parallel_execution": False,
+    "tools": True,
+    "streaming": False,
+    "visualization": True
+})
+
 class CrewAIAdapter(FrameworkAdapter):
     """Adapter for CrewAI framework"""
     
     def __init__(self):
-        # Check if crewai is installed
-        try:
-            self.crewai_available = True
-            import crewai
-            self.crewai_version = crewai.__version__
-            
-            # Import CrewAI modules conditionally
-            from crewai import Agent, Crew, Task
-            self.Agent = Agent
-            self.Crew = Crew
-            self.Task = Task
-            self.has_full_imports = True
-        except ImportError:
-            self.crewai_available = False
+        # Check if crewai is installed without importing it; the package is
+        # only loaded when its version or classes are first accessed
+        self.crewai_available = importlib.util.find_spec("crewai") is not None
+        self.has_full_imports = self.crewai_available
+        if not self.crewai_available:
             logger.warning("CrewAI not installed - some functionality may be limited")
-            self.has_full_imports = False
+    
+    @property
+    def crewai_version(self) -> Optional[str]:
+        """Installed CrewAI version, importing the package on first access"""
+        if not self.crewai_available:
+            return None
+        import crewai
+        return crewai.__version__
+    
+    @property
+    def Agent(self):
+        from crewai import Agent
+        return Agent
+    
+    @property
+    def Crew(self):
+        from crewai import Crew
+        return Crew
+    
+    @property
+    def Task(self):
+        from crewai import Task
+        return Task
             
     def get_framework_name(self) -> str:
         return "crewai"
@@ -55,7 +82,7 @@ class CrewAIAdapter(FrameworkAdapter):
         
         # Process agents
         for i, agent in enumerate(agents):
-            agent_id = agent.get("agent_id", f"agent-{i}")
+            agent_id = sys.intern(agent.get("agent_id") or f"agent-{i}")
             agent_name = agent.get("name", f"Agent {i+1}")
             
             # Generate a role description if one is not provided
@@ -97,8 +124,15 @@ class CrewAIAdapter(FrameworkAdapter):
             
             crewai_config["tasks"].append(task_config)
         
-        # Process tools
+        # Process tools, dropping any that no agent can call
+        referenced_tools = {
+            tool_name
+            for agent_config in crewai_config["agents"]
+            for tool_name in agent_config["tools"]
+        }
         for tool_name, tool_config in tools.items():
+            if tool_name not in referenced_tools:
+                continue
             crewai_config["tools"][tool_name] = {
                 "description": tool_config.get("description", ""),
                 "config": tool_config.get("config", {}),
@@ -142,24 +176,26 @@ class CrewAIAdapter(FrameworkAdapter):
         
         if not agents:
             raise ValueError("No agents defined in the flow")
+        
+        # Index agents and tasks by id once so per-step lookups are O(1)
+        agents_by_id = {agent["id"]: agent for agent in agents}
+        tasks_by_agent = {}
+        for task in tasks:
+            tasks_by_agent.setdefault(task["agent_id"], task)
             
         # Initialize query
         query = input_data.get("query", "")
         if not query:
             raise ValueError("Input must contain a 'query' field")
             
-        # Initialize state
+        # Initialize state, merging any additional input data in a single build
         state = {
-            "query": query,
             "conversation_history": [],
             "iteration": 0,
-            "result": None
+            "result": None,
+            **input_data,
+            "query": query
         }
-        
-        # Add any additional input data to the state
-        for key, value in input_data.items():
-            if key != "query":
-                state[key] = value
                 
         # Start with the first agent/task
         current_step = 1
@@ -172,7 +208,7 @@ class CrewAIAdapter(FrameworkAdapter):
                 agent_name = agent_config["name"]
                 
                 # Find the task for this agent
-                task = next((t for t in tasks if t["agent_id"] == agent_id), None)
+                task = tasks_by_agent.get(agent_id)
                 if not task:
                     # Create a default task if none is defined
                     task = {
@@ -193,7 +229,7 @@ class CrewAIAdapter(FrameworkAdapter):
                         "task": task["description"],
                         "conversation_history": state["conversation_history"]
                     },
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_timestamp()
                 }
                 
                 # Simulate agent execution
@@ -245,7 +281,7 @@ class CrewAIAdapter(FrameworkAdapter):
                             "agent_name": agent_name,
                             "type": "tool_execution",
                             "input": tool_input,
-                            "timestamp": datetime.utcnow().isoformat()
+                            "timestamp": utc_timestamp()
                         }
                         
                         # Simulate tool execution
@@ -255,9 +291,12 @@ class CrewAIAdapter(FrameworkAdapter):
                             tool_config=tools.get(tool_name, {})
                         )
                         
+                        # Serialize the result once for both the trace and the history
+                        tool_result_json = json.dumps(tool_result)
+                        
                         # Update tool step with result
                         tool_step["output"] = {
-                            "content": json.dumps(tool_result),
+                            "content": tool_result_json,
                             "metadata": {"tool": tool_name}
                         }
                         
@@ -275,7 +314,7 @@ class CrewAIAdapter(FrameworkAdapter):
                         state["conversation_history"].append({
                             "role": "tool",
                             "name": tool_name,
-                            "content": json.dumps(tool_result)
+                            "content": tool_result_json
                         })
                         
                         # Increment step counter
@@ -292,7 +331,7 @@ class CrewAIAdapter(FrameworkAdapter):
                                 "tool_result": tool_result,
                                 "task": task["description"]
                             },
-                            "timestamp": datetime.utcnow().isoformat()
+                            "timestamp": utc_timestamp()
                         }
                         
                         # Simulate agent processing tool results
@@ -344,7 +383,7 @@ class CrewAIAdapter(FrameworkAdapter):
                     delegation_reason = agent_response.get("delegation_reason", "")
                     
                     # Find target agent
-                    target_agent = next((a for a in agents if a["id"] == delegate_to), None)
+                    target_agent = agents_by_id.get(delegate_to)
                     
                     if target_agent and agent_config.get("allow_delegation", True):
                         # Create delegation step
@@ -360,7 +399,7 @@ class CrewAIAdapter(FrameworkAdapter):
                                 "task": delegate_task,
                                 "reasoning": delegation_reason
                             },
-                            "timestamp": datetime.utcnow().isoformat()
+                            "timestamp": utc_timestamp()
                         }
                         
                         # Add to execution trace
@@ -391,7 +430,7 @@ class CrewAIAdapter(FrameworkAdapter):
                                 "delegation_from": agent_name,
                                 "conversation_history": state["conversation_history"]
                             },
-                            "timestamp": datetime.utcnow().isoformat()
+                            "timestamp": utc_timestamp()
                         }
                         
                         # Simulate delegated agent execution
@@ -452,7 +491,7 @@ class CrewAIAdapter(FrameworkAdapter):
             completion_step = {
                 "step": current_step,
                 "type": "complete",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_timestamp()
             }
             
             # Add to execution trace
@@ -488,14 +527,14 @@ class CrewAIAdapter(FrameworkAdapter):
             return result
             
         except Exception as e:
-            logger.exception(f"Error executing CrewAI flow: {str(e)}")
+            logger.exception("Error executing CrewAI flow: %s", e)
             
             # Create error step
             error_step = {
                 "step": current_step,
                 "type": "error",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_timestamp()
             }
             
             # Add to execution trace
@@ -759,13 +798,7 @@ class CrewAIAdapter(FrameworkAdapter):
         
     def get_supported_features(self) -> Dict[str, bool]:
         """Return features supported by CrewAI"""
-        return {
-            "multi_agent": True,
-            "parallel_execution": False,
-            "tools": True,
-            "streaming": False,
-            "visualization": True
-        }
+        return dict(CREWAI_FEATURES)
         
     def validate_flow(self, flow_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -786,7 +819,7 @@ class CrewAIAdapter(FrameworkAdapter):
         # Check for valid model providers
         for i, agent in enumerate(agents):
             provider = agent.get("model_provider", "")
-            if provider and provider not in ["openai", "anthropic"]:
+            if provider and provider not in CREWAI_SUPPORTED_PROVIDERS:
                 validation_result["warnings"].append(
                     f"Agent {i+1}: Model provider '{provider}' may not be fully compatible with CrewAI"
                 )
@@ -891,6 +924,12 @@ class CrewAIAdapter(FrameworkAdapter):
             
         # Add tool nodes if requested
         if include_tools:
+            # Index tool -> agent ids once instead of scanning every agent per tool
+            tool_users = {}
+            for agent in agents:
+                for tool_name in dict.fromkeys(agent.get("tools", [])):
+                    tool_users.setdefault(tool_name, []).append(agent["id"])
+            
             for tool_name, tool_config in tools.items():
                 tool_id = f"tool-{tool_name}"
                 nodes.append({
@@ -901,13 +940,12 @@ class CrewAIAdapter(FrameworkAdapter):
                 })
                 
                 # Connect tools to agents that use them
-                for agent in agents:
-                    if tool_name in agent.get("tools", []):
-                        connections.append({
-                            "source": agent["id"],
-                            "target": tool_id,
-                            "type": "uses"
-                        })
+                for agent_id in tool_users.get(tool_name, ()):
+                    connections.append({
+                        "source": agent_id,
+                        "target": tool_id,
+                        "type": "uses"
+                    })
         
         # Format output based on requested format
         if format == "mermaid":
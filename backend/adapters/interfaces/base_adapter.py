@@ -1,6 +1,11 @@
 # backend/adapters/interfaces/base_adapter.py
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Callable, Awaitable
+from datetime import datetime, timezone
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string for trace entries"""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
 
 class FrameworkAdapter(ABC):
     """Base interface for all AI orchestration framework adapters"""
@@ -191,6 +196,13 @@ class FrameworkAdapter(ABC):
                 
         # Add tool nodes if requested
         if include_tools and isinstance(flow, dict) and flow.get("tools"):
+            # Map each tool to the ids of the agents using it in a single pass
+            tool_users = {}
+            for i, agent in enumerate(flow.get("agents", [])):
+                agent_id = agent.get("agent_id", f"agent-{i}")
+                for tool_name in agent.get("tool_names", []):
+                    tool_users.setdefault(tool_name, []).append(agent_id)
+            
             tool_nodes = []
             for tool_name, tool_config in flow.get("tools", {}).items():
                 tool_id = f"tool-{tool_name}"
@@ -202,14 +214,13 @@ class FrameworkAdapter(ABC):
                 })
                 
                 # Connect tools to agents that use them
-                for agent in flow.get("agents", []):
-                    if tool_name in agent.get("tool_names", []):
-                        connections.append({
-                            "source": agent.get("agent_id", f"agent-{flow.get('agents').index(agent)}"),
-                            "target": tool_id,
-                            "type": "tool",
-                            "bidirectional": True
-                        })
+                for agent_id in tool_users.get(tool_name, ()):
+                    connections.append({
+                        "source": agent_id,
+                        "target": tool_id,
+                        "type": "tool",
+                        "bidirectional": True
+                    })
                         
             agents.extend(tool_nodes)
                 
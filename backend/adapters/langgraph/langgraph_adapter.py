@@ -1,11 +1,18 @@
 # backend/adapters/langgraph/langgraph_adapter.py
-from typing import Dict, List, Any, Optional, Callable, Awaitable, Union
+from typing import Dict, List, Any, Optional, Callable, Awaitable, Union, Tuple
 import asyncio
 import logging
 import json
 import importlib
+import importlib.util
 import inspect
-from datetime import datetime
+import os
+import sys
+import hashlib
+import random
+import time
+from collections import OrderedDict
+from itertools import islice
 from typing import TypedDict, Annotated, List, Dict, Any, Optional
 
 # Pydantic for state management
@@ -25,22 +32,44 @@ from langgraph.graph import StateGraph, END
 from langgraph.checkpoint import MemorySaver
 from langgraph.prebuilt import tools_condition
 
-# LLM Providers
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-
 # Adapter and base dependencies
-from ...adapters.interfaces.base_adapter import FrameworkAdapter
+from ...adapters.interfaces.base_adapter import FrameworkAdapter, utc_timestamp
 from ...services.tool.registry_service import get_tool_registry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Use orjson for hot-path serialization when available
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf-8")
+        except TypeError:
+            # orjson rejects integers beyond 64 bits and non-str keys, which json accepts
+            return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"))
+except ImportError:
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"))
+
 class LangGraphAdapter(FrameworkAdapter):
     """Advanced adapter for LangGraph framework with comprehensive integration"""
     
-    def __init__(self):
+    def __init__(
+        self, 
+        response_cache_size: int = 256,
+        response_cache_ttl: float = 300.0,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 500,
+        http_timeout: float = 120.0,
+        http_retries: int = 2,
+        max_concurrent_requests: int = 50,
+        max_llm_retries: int = 4,
+        stream_chunk_size: int = 64,
+        max_tool_result_chars: int = 20000,
+        max_tool_concurrency: int = 4
+    ):
         """Initialize the LangGraph adapter with advanced configuration"""
         # LLM provider mapping
         self.llm_providers = {
@@ -54,18 +83,100 @@ class LangGraphAdapter(FrameworkAdapter):
         
         # Checkpoint for maintaining conversation state
         self.checkpoint_handler = MemorySaver()
+        
+        # Limit for concurrent tool calls within a single agent step
+        self.max_tool_concurrency = max_tool_concurrency
+        
+        # LRU of deterministic (temperature 0) LLM responses
+        self._response_cache: "OrderedDict[str, Tuple[float, AIMessage]]" = OrderedDict()
+        self._response_cache_size = response_cache_size
+        self._response_cache_ttl = response_cache_ttl  # Seconds a cached response stays valid
+        
+        # Model calls in flight, keyed like the response cache, so concurrent duplicates share one call
+        self._pending_responses: Dict[str, asyncio.Future] = {}
+        
+        # Chat model instances keyed by provider, model name and temperature
+        self._llm_instances: Dict[Tuple[str, str, float], BaseChatModel] = {}
+        
+        # Models with tools bound, keyed by model and tool wrapper identity
+        self._bound_models: Dict[Tuple[int, Tuple[int, ...]], Any] = {}
+        
+        # BaseTool wrappers keyed by tool name and description
+        self._tool_wrappers: Dict[Tuple[str, str], BaseTool] = {}
+        
+        # HTTP connection pool shared by provider clients, created on first use
+        self._http_client = None
+        self._http_limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections
+        }
+        self._http_timeout = http_timeout
+        self._http_retries = http_retries  # Transport-level retries for failed connection attempts
+        
+        # Cap in-flight model calls and retry rate-limited ones with backoff
+        self._llm_semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self.max_llm_retries = max_llm_retries
+        
+        # Minimum number of characters coalesced before a streamed token update is emitted
+        self.stream_chunk_size = stream_chunk_size
+        
+        # Longest serialized tool result kept in the conversation sent back to the model
+        self.max_tool_result_chars = max_tool_result_chars
     
     def get_framework_name(self) -> str:
         """Return the framework name"""
         return "langgraph"
     
+    def _get_http_client(self):
+        """Return the shared async HTTP client, creating it on first use"""
+        if self._http_client is None:
+            import httpx
+            # Multiplex concurrent requests over HTTP/2 when the h2 package is installed
+            transport = httpx.AsyncHTTPTransport(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(**self._http_limits),
+                retries=self._http_retries
+            )
+            self._http_client = httpx.AsyncClient(
+                transport=transport,
+                timeout=httpx.Timeout(self._http_timeout)
+            )
+        return self._http_client
+    
+    async def prewarm(self, connections: int = 4) -> None:
+        """
+        Open connections to the OpenAI API ahead of the first model call
+        
+        Args:
+            connections: Number of concurrent connections to establish
+        """
+        if not os.environ.get("OPENAI_API_KEY"):
+            return
+        
+        client = self._get_http_client()
+        results = await asyncio.gather(
+            *(client.head("https://api.openai.com/v1/models") for _ in range(connections)),
+            return_exceptions=True
+        )
+        failures = sum(isinstance(result, Exception) for result in results)
+        if failures:
+            logger.debug("Connection prewarm failed for %d of %d connections", failures, connections)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     def _create_openai_llm(self, model_name: str, temperature: float) -> BaseChatModel:
         """Create an OpenAI language model instance"""
         try:
+            from langchain_openai import ChatOpenAI
             return ChatOpenAI(
                 model=model_name, 
                 temperature=temperature, 
-                streaming=True
+                streaming=True,
+                http_async_client=self._get_http_client()
             )
         except ImportError:
             logger.error("OpenAI LLM import failed")
@@ -74,6 +185,7 @@ class LangGraphAdapter(FrameworkAdapter):
     def _create_anthropic_llm(self, model_name: str, temperature: float) -> BaseChatModel:
         """Create an Anthropic language model instance"""
         try:
+            from langchain_anthropic import ChatAnthropic
             return ChatAnthropic(
                 model=model_name, 
                 temperature=temperature, 
@@ -86,6 +198,7 @@ class LangGraphAdapter(FrameworkAdapter):
     def _create_google_llm(self, model_name: str, temperature: float) -> BaseChatModel:
         """Create a Google language model instance"""
         try:
+            from langchain_google_genai import ChatGoogleGenerativeAI
             return ChatGoogleGenerativeAI(
                 model=model_name, 
                 temperature=temperature, 
@@ -103,18 +216,300 @@ class LangGraphAdapter(FrameworkAdapter):
             agent_config: Configuration dictionary for the agent
         
         Returns:
-            Instantiated language model
+            Instantiated language model, shared by agents with the same settings
         """
         provider = agent_config.get("model_provider", "openai").lower()
         model_name = agent_config.get("model_name", "gpt-4")
         temperature = agent_config.get("temperature", 0.7)
         
+        cache_key = (provider, model_name, temperature)
+        llm = self._llm_instances.get(cache_key)
+        if llm is not None:
+            return llm
+        
         # Select provider function
         provider_func = self.llm_providers.get(provider)
         if not provider_func:
             raise ValueError(f"Unsupported LLM provider: {provider}")
         
-        return provider_func(model_name, temperature)
+        llm = provider_func(model_name, temperature)
+        self._llm_instances[cache_key] = llm
+        return llm
+    
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        """Check whether a provider error is a rate limit (HTTP 429) response"""
+        if getattr(error, "status_code", None) == 429:
+            return True
+        return any(cls.__name__ == "RateLimitError" for cls in type(error).__mro__)
+    
+    async def _invoke_llm(
+        self, 
+        chain: Any, 
+        messages: List[Any],
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> AIMessage:
+        """
+        Call a model, bounded by the adapter's concurrency limit
+        
+        Rate-limited calls are retried with jittered exponential backoff.
+        
+        Args:
+            chain: Model (with tools bound) to call
+            messages: Messages to send
+            on_token: Optional callback receiving streamed text as it arrives
+            
+        Returns:
+            Model response
+        """
+        for attempt in range(self.max_llm_retries + 1):
+            try:
+                async with self._llm_semaphore:
+                    if on_token is None:
+                        return await chain.ainvoke(messages)
+                    return await self._stream_llm(chain, messages, on_token)
+            except Exception as e:
+                if attempt >= self.max_llm_retries or not self._is_rate_limit_error(e):
+                    raise
+                delay = random.uniform(0, 2 ** attempt)
+                logger.warning("LLM rate limited, retrying in %.2fs (attempt %d)", delay, attempt + 1)
+                await asyncio.sleep(delay)
+    
+    async def _stream_llm(
+        self, 
+        chain: Any, 
+        messages: List[Any],
+        on_token: Callable[[str], Awaitable[None]]
+    ) -> AIMessage:
+        """
+        Stream a model response, forwarding text in coalesced chunks
+        
+        Args:
+            chain: Model (with tools bound) to call
+            messages: Messages to send
+            on_token: Callback receiving streamed text
+            
+        Returns:
+            Complete model response assembled from the streamed chunks
+        """
+        response = None
+        buffer = []
+        buffered = 0
+        async for chunk in chain.astream(messages):
+            response = chunk if response is None else response + chunk
+            if isinstance(chunk.content, str) and chunk.content:
+                buffer.append(chunk.content)
+                buffered += len(chunk.content)
+                if buffered >= self.stream_chunk_size:
+                    await on_token("".join(buffer))
+                    buffer.clear()
+                    buffered = 0
+        if buffer:
+            await on_token("".join(buffer))
+        return response
+    
+    def _create_system_message(self, agent_config: Dict[str, Any]) -> Optional[SystemMessage]:
+        """
+        Build the system message for an agent
+        
+        Args:
+            agent_config: Configuration dictionary for the agent
+            
+        Returns:
+            System message, or None if the agent has no system prompt
+        """
+        system_msg = agent_config.get("system_message")
+        if not system_msg:
+            return None
+        
+        # Anthropic can cache the unchanging system prompt prefix across calls
+        if agent_config.get("model_provider", "openai").lower() == "anthropic":
+            return SystemMessage(content=[{
+                "type": "text",
+                "text": system_msg,
+                "cache_control": {"type": "ephemeral"}
+            }])
+        
+        return SystemMessage(content=system_msg)
+    
+    def _make_response_cache_key(
+        self, 
+        agent_config: Dict[str, Any], 
+        messages: List[Any]
+    ) -> Optional[str]:
+        """
+        Build a cache key for an LLM call
+        
+        Args:
+            agent_config: Configuration dictionary for the agent
+            messages: Messages sent to the model
+            
+        Returns:
+            Cache key, or None if the call must not be cached (sampled calls are
+            only cached when the agent opts in with "cache_responses")
+        """
+        temperature = agent_config.get("temperature", 0.7)
+        if temperature != 0 and not agent_config.get("cache_responses", False):
+            return None
+        
+        payload = {
+            "provider": agent_config.get("model_provider", "openai").lower(),
+            "model": agent_config.get("model_name", "gpt-4"),
+            "temperature": temperature,
+            "tools": sorted(agent_config.get("tools", [])),
+            "messages": [
+                [message.type, getattr(message, "name", None), self._normalize_content(message.content)]
+                for message in messages
+            ]
+        }
+        try:
+            serialized = _json_dumps(payload, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _normalize_content(content: Any) -> Any:
+        """Trim outer and trailing-line whitespace so trivially reformatted prompts share a cache entry"""
+        if isinstance(content, str):
+            # Newlines and indentation are kept, since they can change what the text means
+            return "\n".join(line.rstrip() for line in content.strip().splitlines())
+        return content
+    
+    def _get_cached_response(self, cache_key: Optional[str]) -> Optional[AIMessage]:
+        """Return an unexpired cached LLM response and mark it as recently used"""
+        if cache_key is None:
+            return None
+        entry = self._response_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._response_cache[cache_key]
+            return None
+        
+        self._response_cache.move_to_end(cache_key)
+        return response
+    
+    async def _invoke_llm_once(
+        self, 
+        cache_key: Optional[str], 
+        chain: Any, 
+        messages: List[Any],
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> AIMessage:
+        """
+        Call a model, sharing one in-flight call between identical deterministic requests
+        
+        Args:
+            cache_key: Response cache key, or None if the request must not be shared
+            chain: Model (with tools bound) to call
+            messages: Messages to send
+            on_token: Optional callback receiving streamed text as it arrives
+            
+        Returns:
+            Model response
+        """
+        if cache_key is None:
+            return await self._invoke_llm(chain, messages, on_token)
+        
+        pending = self._pending_responses.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._invoke_llm(chain, messages, on_token))
+            self._pending_responses[cache_key] = pending
+            pending.add_done_callback(lambda _: self._pending_responses.pop(cache_key, None))
+        
+        response = await asyncio.shield(pending)
+        self._cache_response(cache_key, response)
+        return response
+    
+    def _cache_response(self, cache_key: Optional[str], response: AIMessage) -> None:
+        """Store an LLM response, evicting the least recently used entry when full"""
+        if cache_key is None:
+            return
+        self._response_cache[cache_key] = (time.monotonic() + self._response_cache_ttl, response)
+        self._response_cache.move_to_end(cache_key)
+        if len(self._response_cache) > self._response_cache_size:
+            self._response_cache.popitem(last=False)
+    
+    def _tool_result_content(self, tool_result: Any) -> str:
+        """
+        Serialize a tool result for the conversation history
+        
+        The full result stays in the execution trace; only the copy that is
+        re-sent to the model on every later step is truncated.
+        
+        Args:
+            tool_result: Result returned by the tool registry
+            
+        Returns:
+            JSON string of at most max_tool_result_chars characters (plus a marker)
+        """
+        content = _json_dumps(tool_result)
+        if len(content) > self.max_tool_result_chars:
+            content = content[:self.max_tool_result_chars] + " ...[truncated]"
+        return content
+    
+    def _get_fallback_configs(self, agent_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Resolve an agent's fallback models into LLM configurations
+        
+        Args:
+            agent_config: Configuration dictionary for the agent; each entry of
+                "fallback_models" is a model name for the same provider or a dict
+                overriding model_provider, model_name and/or temperature
+        
+        Returns:
+            List of agent configurations, one per fallback model
+        """
+        fallback_configs = []
+        for fallback in agent_config.get("fallback_models", []):
+            if isinstance(fallback, str):
+                fallback = {"model_name": fallback}
+            fallback_configs.append({**agent_config, **fallback})
+        return fallback_configs
+    
+    def _wrap_tool(self, tool_name: str, description: str) -> BaseTool:
+        """
+        Wrap a registry tool in a BaseTool compatible interface
+        
+        Args:
+            tool_name: Name of the tool in the registry
+            description: Tool description shown to the model
+        
+        Returns:
+            Tool object that executes through the registry
+        """
+        # Execute tool through registry to get the actual function
+        async def tool_wrapper(params):
+            return await self.tool_registry.execute_tool(tool_name, params)
+        
+        return BaseTool(
+            name=tool_name,
+            description=description,
+            func=tool_wrapper
+        )
+    
+    def _bind_tools(self, llm: BaseChatModel, tools: List[BaseTool]) -> Any:
+        """
+        Bind tools to a model, reusing the binding for the same model and tool set
+        
+        Args:
+            llm: Language model (a cached instance from _create_llm)
+            tools: Tool wrappers (cached instances from _create_tools)
+        
+        Returns:
+            Model with the tool schemas bound
+        """
+        # Both the model and the tool wrappers are held by the adapter's caches,
+        # so their identities are stable keys for the converted schemas
+        cache_key = (id(llm), tuple(id(tool) for tool in tools))
+        chain = self._bound_models.get(cache_key)
+        if chain is None:
+            chain = llm.bind_tools(tools)
+            self._bound_models[cache_key] = chain
+        return chain
     
     def _create_tools(self, tool_names: List[str]) -> List[BaseTool]:
         """
@@ -132,23 +527,20 @@ class LangGraphAdapter(FrameworkAdapter):
                 # Get tool configuration from registry
                 tool_config = self.tool_registry.get_tool(tool_name)
                 if not tool_config:
-                    logger.warning(f"Tool {tool_name} not found in registry")
+                    logger.warning("Tool %s not found in registry", tool_name)
                     continue
                 
-                # Execute tool through registry to get the actual function
-                async def tool_wrapper(params):
-                    return await self.tool_registry.execute_tool(tool_name, params)
-                
-                # Wrap the tool in a BaseTool compatible interface
-                tool = BaseTool(
-                    name=tool_name,
-                    description=tool_config.get("description", ""),
-                    func=tool_wrapper
-                )
+                # Reuse the wrapper built for this tool on an earlier execution
+                description = tool_config.get("description", "")
+                cache_key = (tool_name, description)
+                tool = self._tool_wrappers.get(cache_key)
+                if tool is None:
+                    tool = self._wrap_tool(tool_name, description)
+                    self._tool_wrappers[cache_key] = tool
                 tools.append(tool)
                 
             except Exception as e:
-                logger.error(f"Error creating tool {tool_name}: {str(e)}")
+                logger.error("Error creating tool %s: %s", tool_name, e)
         
         return tools
     
@@ -175,8 +567,15 @@ class LangGraphAdapter(FrameworkAdapter):
             "max_iterations": flow_config.get("max_steps", 10)
         }
         
-        # Process tools
+        # Process tools, dropping any that no agent can call
+        referenced_tools = {
+            tool_name
+            for agent_config in flow_config.get("agents", [])
+            for tool_name in agent_config.get("tool_names", [])
+        }
         for tool_name, tool_config in flow_config.get("tools", {}).items():
+            if tool_name not in referenced_tools:
+                continue
             langgraph_config["tools"][tool_name] = {
                 "description": tool_config.get("description", ""),
                 "config": tool_config.get("config", {})
@@ -185,13 +584,15 @@ class LangGraphAdapter(FrameworkAdapter):
         # Process agents
         for agent_config in flow_config.get("agents", []):
             agent_entry = {
-                "id": agent_config.get("agent_id", f"agent-{len(langgraph_config['agents'])}"),
+                "id": sys.intern(agent_config.get("agent_id") or f"agent-{len(langgraph_config['agents'])}"),
                 "name": agent_config.get("name", "Unnamed Agent"),
                 "model_provider": agent_config.get("model_provider", "openai"),
                 "model_name": agent_config.get("model_name", "gpt-4"),
                 "temperature": agent_config.get("temperature", 0.7),
                 "system_message": agent_config.get("system_message", ""),
-                "tools": agent_config.get("tool_names", [])
+                "tools": agent_config.get("tool_names", []),
+                "fallback_models": agent_config.get("fallback_models", []),
+                "cache_responses": agent_config.get("cache_responses", False)
             }
             
             langgraph_config["agents"].append(agent_entry)
@@ -231,49 +632,84 @@ class LangGraphAdapter(FrameworkAdapter):
             # Track execution trace
             execution_trace = []
             
+            # LangChain messages built from conversation history entries, shared by all agents
+            # The history only ever grows, so each entry is converted once and the list is extended
+            history_messages: List[Any] = []
+            history_converted = 0
+            
             # Create LLMs and tool configurations for each agent
             agent_nodes = {}
-            for agent_config in flow.get("agents", []):
+            
+            def build_agent_node(agent_config: Dict[str, Any]):
+                # Resolve per-agent values once instead of on every step
+                agent_id = agent_config["id"]
+                agent_name = agent_config.get("name")
+                system_message = self._create_system_message(agent_config)
+                
                 # Create LLM
                 llm = self._create_llm(agent_config)
                 
-                # Create tools
+                # Create tools and bind them to the LLM
                 tools = self._create_tools(agent_config.get("tools", []))
+                chain = self._bind_tools(llm, tools)
+                
+                # Fall back to alternative models when the primary one fails
+                fallback_chains = [
+                    self._bind_tools(self._create_llm(fallback_config), tools)
+                    for fallback_config in self._get_fallback_configs(agent_config)
+                ]
+                if fallback_chains:
+                    chain = chain.with_fallbacks(fallback_chains)
+                
+                # Forward partial model output to the step callback while streaming
+                on_token = None
+                if step_callback:
+                    async def on_token(text: str) -> None:
+                        await step_callback({
+                            "type": "token",
+                            "agent_id": agent_id,
+                            "content": text
+                        })
                 
                 # Define agent node function
                 async def agent_node(state: GraphState) -> Dict[str, Any]:
-                    # Prepare messages
-                    messages = []
-                    
-                    # Add system message
-                    system_msg = agent_config.get("system_message")
-                    if system_msg:
-                        messages.append(SystemMessage(content=system_msg))
+                    nonlocal history_converted
                     
-                    # Add conversation history
-                    for msg in state.conversation_history:
-                        if msg["role"] == "human":
-                            messages.append(HumanMessage(content=msg["content"]))
-                        elif msg["role"] == "agent":
-                            messages.append(AIMessage(content=msg["content"]))
-                        elif msg["role"] == "tool":
-                            messages.append(FunctionMessage(
+                    # Convert only the history entries added since the previous step
+                    history = state.conversation_history
+                    if len(history) < history_converted:
+                        history_messages.clear()
+                        history_converted = 0
+                    append = history_messages.append
+                    for msg in islice(history, history_converted, None):
+                        role = msg["role"]
+                        if role == "human":
+                            append(HumanMessage(content=msg["content"]))
+                        elif role == "agent":
+                            append(AIMessage(content=msg["content"]))
+                        elif role == "tool":
+                            append(FunctionMessage(
                                 name=msg.get("name", "tool"), 
                                 content=msg["content"]
                             ))
+                    history_converted = len(history)
                     
-                    # Add current query
+                    # Prepare messages: prebuilt system message, converted history, current query
+                    messages = [system_message] if system_message is not None else []
+                    messages.extend(history_messages)
                     messages.append(HumanMessage(content=state.query))
                     
-                    # Call LLM
-                    chain = llm.bind_tools(tools)
-                    response = await chain.ainvoke(messages)
+                    # Call LLM, reusing the response for identical deterministic requests
+                    cache_key = self._make_response_cache_key(agent_config, messages)
+                    response = self._get_cached_response(cache_key)
+                    if response is None:
+                        response = await self._invoke_llm_once(cache_key, chain, messages, on_token)
                     
                     # Update step trace
                     step_trace = {
                         "step": len(execution_trace) + 1,
-                        "agent_id": agent_config.get("agent_id"),
-                        "agent_name": agent_config.get("name"),
+                        "agent_id": agent_id,
+                        "agent_name": agent_name,
                         "input": {"query": state.query},
                         "output": {
                             "content": response.content if response.content else "",
@@ -282,13 +718,13 @@ class LangGraphAdapter(FrameworkAdapter):
                                 for tool_call in response.tool_calls
                             ] if response.tool_calls else []
                         },
-                        "timestamp": datetime.utcnow().isoformat()
+                        "usage": getattr(response, "usage_metadata", None) or {},
+                        "timestamp": utc_timestamp()
                     }
                     execution_trace.append(step_trace)
                     
-                    # Call step callback if provided
-                    if step_callback:
-                        await step_callback(step_trace)
+                    # Call step callback if provided (awaited alongside any tool calls below)
+                    step_notification = step_callback(step_trace) if step_callback else None
                     
                     # Prepare return state
                     new_state = {
@@ -302,15 +738,38 @@ class LangGraphAdapter(FrameworkAdapter):
                     }
                     
                     # Check for tool execution
-                    if response.tool_calls:
-                        # Execute tools sequentially
-                        for tool_call in response.tool_calls:
+                    if not response.tool_calls and step_notification is not None:
+                        await step_notification
+                    elif response.tool_calls:
+                        # Execute independent tool calls concurrently, bounded per step
+                        semaphore = asyncio.Semaphore(self.max_tool_concurrency)
+                        
+                        async def run_tool_call(tool_call):
+                            async with semaphore:
+                                return await self.tool_registry.execute_tool(tool_call.name, tool_call.args)
+                        
+                        # Launch the slowest tools first so they don't queue behind quick ones
+                        launch_order = sorted(
+                            range(len(response.tool_calls)),
+                            key=lambda i: -self.tool_registry.get_expected_latency(response.tool_calls[i].name)
+                        )
+                        pending = [run_tool_call(response.tool_calls[i]) for i in launch_order]
+                        if step_notification is not None:
+                            pending.append(step_notification)
+                        launched_results = await asyncio.gather(*pending)
+                        tool_results = [None] * len(launch_order)
+                        for i, tool_result in zip(launch_order, launched_results):
+                            tool_results[i] = tool_result
+                        
+                        # The calls were gathered together, so they share one completion timestamp
+                        completed_at = utc_timestamp()
+                        
+                        # Record results in the order the model requested them
+                        tool_notifications = []
+                        for tool_call, tool_result in zip(response.tool_calls, tool_results):
                             tool_name = tool_call.name
                             tool_args = tool_call.args
                             
-                            # Execute tool
-                            tool_result = await self.tool_registry.execute_tool(tool_name, tool_args)
-                            
                             # Update trace
                             tool_trace = {
                                 "step": len(execution_trace) + 1,
@@ -318,35 +777,45 @@ class LangGraphAdapter(FrameworkAdapter):
                                 "tool": tool_name,
                                 "input": tool_args,
                                 "output": tool_result,
-                                "timestamp": datetime.utcnow().isoformat()
+                                "timestamp": completed_at
                             }
                             execution_trace.append(tool_trace)
                             
-                            # Call step callback if provided
+                            # Call step callback if provided (all tool steps are delivered together below)
                             if step_callback:
-                                await step_callback(tool_trace)
+                                tool_notifications.append(step_callback(tool_trace))
                             
                             # Update conversation history with tool result
                             new_state["conversation_history"].append({
                                 "role": "tool", 
                                 "name": tool_name, 
-                                "content": json.dumps(tool_result)
+                                "content": self._tool_result_content(tool_result)
                             })
+                        
+                        # Deliver tool step updates concurrently; they are scheduled in trace order
+                        if tool_notifications:
+                            await asyncio.gather(*tool_notifications)
                     
                     return new_state
                 
+                return agent_node
+            
+            for agent_config in flow.get("agents", []):
                 # Store agent node for later use
-                agent_nodes[agent_config.get("agent_id")] = agent_node
+                agent_nodes[agent_config["id"]] = build_agent_node(agent_config)
             
             # Add nodes to graph
             for agent_id, node_func in agent_nodes.items():
                 graph.add_node(agent_id, node_func)
             
+            # Resolve routing ids once instead of rebuilding the key list per step
+            agent_ids = list(agent_nodes.keys())
+            entry_agent_id = agent_ids[0]
+            last_agent_id = agent_ids[-1]
+            
             # Add edges between agents (if not specified, create sequential flow)
-            if len(agent_nodes) > 1:
-                agent_ids = list(agent_nodes.keys())
-                for i in range(len(agent_ids) - 1):
-                    graph.add_edge(agent_ids[i], agent_ids[i+1])
+            for source_id, target_id in zip(agent_ids, agent_ids[1:]):
+                graph.add_edge(source_id, target_id)
             
             # Add a condition to route between nodes or end
             def router(state: GraphState):
@@ -355,15 +824,15 @@ class LangGraphAdapter(FrameworkAdapter):
                     return END
                 
                 # Continue to next agent or default behavior
-                return state.current_agent or list(agent_nodes.keys())[0]
+                return state.current_agent or entry_agent_id
             
             graph.add_conditional_edges(
-                list(agent_nodes.keys())[-1],  # Last agent
+                last_agent_id,
                 router
             )
             
             # Set entry point
-            graph.set_entry_point(list(agent_nodes.keys())[0])
+            graph.set_entry_point(entry_agent_id)
             
             # Compile the graph
             compiled_graph = graph.compile(
@@ -404,7 +873,7 @@ class LangGraphAdapter(FrameworkAdapter):
             return result
         
         except Exception as e:
-            logger.exception(f"Error executing LangGraph flow: {str(e)}")
+            logger.exception("Error executing LangGraph flow: %s", e)
             return {
                 "output": {
                     "error": str(e),
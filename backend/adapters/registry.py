@@ -7,8 +7,11 @@ from .crewai.crewai_adapter import CrewAIAdapter
 class AdapterRegistry:
     """Registry for framework adapters"""
     
+    __slots__ = ("_adapters", "_get_adapter")
+    
     def __init__(self):
         self._adapters = {}
+        self._get_adapter = self._adapters.get  # Bound once for the lookup on every execution
         self._register_defaults()
     
     def _register_defaults(self):
@@ -22,9 +25,10 @@ class AdapterRegistry:
     
     def get_adapter(self, name: str) -> FrameworkAdapter:
         """Get an adapter by name"""
-        if name not in self._adapters:
+        adapter = self._get_adapter(name)
+        if adapter is None:
             raise ValueError(f"Framework adapter '{name}' not found")
-        return self._adapters[name]
+        return adapter
     
     def get_all_adapters(self) -> Dict[str, FrameworkAdapter]:
         """Get all registered adapters"""
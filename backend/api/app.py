@@ -3,8 +3,8 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-import traceback
 import logging
+import asyncio
 import time
 import os
 
@@ -25,6 +25,23 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Serialize responses with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse
+    
+    class DefaultResponse(ORJSONResponse):
+        """orjson response that falls back to the standard encoder for values orjson rejects"""
+        
+        def render(self, content) -> bytes:
+            try:
+                return super().render(content)
+            except TypeError:
+                # orjson can't encode integers beyond 64 bits, e.g. large calculate results
+                return JSONResponse.render(self, content)
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Create FastAPI app
 app = FastAPI(
     title="NexusFlow.ai API",
@@ -32,7 +49,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    redirect_slashes=False  # Add this line
+    redirect_slashes=False,  # Add this line
+    default_response_class=DefaultResponse
 )
 
 # Configure CORS
@@ -53,19 +71,20 @@ async def error_handler(request: Request, call_next):
     """
     Middleware to catch and format errors consistently
     """
-    start_time = time.time()
+    # Only time requests when the timing would actually be logged
+    start_time = time.perf_counter() if logger.isEnabledFor(logging.DEBUG) else None
     try:
         response = await call_next(request)
         
         # Log request completion time for performance monitoring
-        process_time = time.time() - start_time
-        logger.debug(f"Request {request.method} {request.url.path} completed in {process_time:.4f}s")
+        if start_time is not None:
+            process_time = time.perf_counter() - start_time
+            logger.debug("Request %s %s completed in %.4fs", request.method, request.url.path, process_time)
         
         return response
     except Exception as e:
         # Log the full error with traceback
-        logger.error(f"Unhandled exception in {request.method} {request.url.path}: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Unhandled exception in %s %s: %s", request.method, request.url.path, e)
         
         # Return a standardized error response
         return JSONResponse(
@@ -160,6 +179,14 @@ async def startup_event():
         available_frameworks = adapter_registry.get_available_frameworks()
         logger.info(f"Available frameworks: {', '.join(available_frameworks.keys())}")
         
+        # Warm adapter connection pools in the background when enabled
+        app.state.prewarm_tasks = []
+        if os.environ.get("PREWARM_CONNECTIONS", "false").lower() == "true":
+            for adapter in adapter_registry.get_all_adapters().values():
+                prewarm = getattr(adapter, "prewarm", None)
+                if prewarm is not None:
+                    app.state.prewarm_tasks.append(asyncio.create_task(prewarm()))
+        
         # Check available tools
         tool_registry = get_tool_registry()
         tools = tool_registry.get_all_tools()
@@ -168,8 +195,41 @@ async def startup_event():
         # Log successful startup
         logger.info("NexusFlow.ai API started successfully")
     except Exception as e:
-        logger.error(f"Error during startup: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error during startup: %s", e)
+
+# Shutdown event to release shared resources
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Cleanup tasks when the API stops
+    """
+    from ..adapters.registry import get_adapter_registry
+    from ..services.tool.registry_service import get_tool_registry
+    from ..tools.default_tools import close_http_session
+    
+    # Stop connection prewarming that is still running
+    prewarm_tasks = getattr(app.state, "prewarm_tasks", [])
+    for task in prewarm_tasks:
+        task.cancel()
+    for result in await asyncio.gather(*prewarm_tasks, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.error(f"Error prewarming connections: {str(result)}")
+    
+    # Close the HTTP session used by default tools
+    close_http_session()
+    
+    # Stop the tool worker threads
+    get_tool_registry().shutdown()
+    
+    # Close connection pools held by adapters
+    for name, adapter in get_adapter_registry().get_all_adapters().items():
+        aclose = getattr(adapter, "aclose", None)
+        if aclose is None:
+            continue
+        try:
+            await aclose()
+        except Exception as e:
+            logger.error(f"Error closing adapter {name}: {str(e)}")
 
 # Add middleware to log all requests
 @app.middleware("http")
@@ -2,7 +2,6 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 import logging
-import traceback
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +13,7 @@ async def error_handler(request: Request, call_next):
         return await call_next(request)
     except Exception as e:
         # Log the full error with traceback
-        logger.error(f"Unhandled exception: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Unhandled exception: %s", e)
         
         # Return a standardized error response
         return JSONResponse(
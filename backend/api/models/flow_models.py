@@ -1,6 +1,6 @@
 # backend/api/models/flow_models.py
 from pydantic import BaseModel, Field, validator
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import uuid
 
@@ -32,6 +32,8 @@ class AgentCreate(BaseModel):
     capabilities: List[str] = Field(default_factory=list)
     tool_names: List[str] = Field(default_factory=list)
     can_delegate: Optional[bool] = True
+    fallback_models: List[Union[str, Dict[str, Any]]] = Field(default_factory=list)
+    cache_responses: bool = False
 
 # Tool configuration
 class ToolConfig(BaseModel):
@@ -204,10 +204,19 @@ async def execution_websocket(
         # Track last step seen to send only new updates
         last_step_seen = 0
         
+        # Number of live trace entries already sent
+        steps_sent = 0
+        
+        # Streamed model output already sent for the step in progress
+        last_partial_output = ""
+        
         # Keep connection open and send updates
         while True:
-            # Get latest execution status
-            current_execution = await execution_service.get_execution_status(execution_id)
+            # Get latest execution status, skipping live steps already sent
+            current_execution = await execution_service.get_execution_status(
+                execution_id,
+                since_step=steps_sent
+            )
             
             # Check if execution is complete or failed
             if current_execution["status"] in ["completed", "failed", "cancelled"]:
@@ -225,11 +234,16 @@ async def execution_websocket(
                 break
             
             # Send any new steps in the execution trace
-            execution_trace = current_execution.get("execution_trace", [])
-            new_steps = [
-                step for step in execution_trace 
-                if step.get("step", 0) > last_step_seen
-            ]
+            if current_execution.get("streaming"):
+                # Live executions already return only the steps after our cursor
+                new_steps = current_execution.get("current_trace", [])
+                steps_sent = current_execution.get("current_step", steps_sent)
+            else:
+                execution_trace = current_execution.get("execution_trace", [])
+                new_steps = [
+                    step for step in execution_trace 
+                    if step.get("step", 0) > last_step_seen
+                ]
             
             if new_steps:
                 # Update last step seen
@@ -243,6 +257,17 @@ async def execution_websocket(
                     "complete": False
                 })
             
+            # Send streamed model output for the step in progress
+            partial_output = current_execution.get("partial_output")
+            if partial_output and partial_output != last_partial_output:
+                last_partial_output = partial_output
+                await websocket.send_json({
+                    "execution_id": execution_id,
+                    "status": current_execution["status"],
+                    "partial_output": partial_output,
+                    "complete": False
+                })
+            
             # Wait before checking again
             await asyncio.sleep(1)
             
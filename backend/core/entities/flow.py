@@ -6,6 +6,18 @@ import uuid
 class Flow:
     """Core flow entity"""
     
+    __slots__ = (
+        "flow_id",
+        "name",
+        "description",
+        "agents",
+        "max_steps",
+        "tools",
+        "framework",
+        "created_at",
+        "updated_at"
+    )
+    
     def __init__(
         self, 
         name: str,
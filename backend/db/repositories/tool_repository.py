@@ -3,6 +3,7 @@ from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, desc, func
 from datetime import datetime
+import json
 
 from ..models.tool_model import ToolModel
 
@@ -131,10 +132,9 @@ class ToolRepository:
         categories = {}
         
         for tool in tools:
-            if hasattr(tool, 'metadata') and tool.metadata:
-                metadata = tool.metadata
+            metadata = getattr(tool, 'metadata', None)
+            if metadata:
                 if isinstance(metadata, str):
-                    import json
                     try:
                         metadata = json.loads(metadata)
                     except (json.JSONDecodeError, TypeError):
@@ -206,10 +206,9 @@ class ToolRepository:
         
         compatible_tools = []
         for tool in all_tools:
-            if hasattr(tool, 'metadata') and tool.metadata:
-                metadata = tool.metadata
+            metadata = getattr(tool, 'metadata', None)
+            if metadata:
                 if isinstance(metadata, str):
-                    import json
                     try:
                         metadata = json.loads(metadata)
                     except (json.JSONDecodeError, TypeError):
@@ -2,9 +2,13 @@
 import uuid
 import logging
 import json
+import copy
 import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator, Callable, Awaitable
 
 from ...db.repositories.flow_repository import FlowRepository
 from ...db.repositories.execution_repository import ExecutionRepository
@@ -12,21 +16,37 @@ from ...adapters.registry import get_adapter_registry
 
 logger = logging.getLogger(__name__)
 
+# Framework-specific flow configs shared across service instances, keyed by
+# adapter and flow version so an updated flow is converted again
+_converted_flows: "OrderedDict[Tuple[Any, str, Any], Any]" = OrderedDict()
+_CONVERTED_FLOWS_MAX_SIZE = 128
+
+# Workers for execution history queries, shared across service instances and
+# kept apart from the loop's default executor
+_query_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="execution-query")
+
 class ExecutionService:
     """Service for executing flows and managing execution state"""
     
-    def __init__(self, flow_repository: FlowRepository, execution_repository: ExecutionRepository):
+    def __init__(
+        self,
+        flow_repository: FlowRepository,
+        execution_repository: ExecutionRepository,
+        live_trace_limit: int = 200
+    ):
         self.flow_repository = flow_repository
         self.execution_repository = execution_repository
         self.adapter_registry = get_adapter_registry()
         self._active_executions = {}  # Store references to active executions
+        self.live_trace_limit = live_trace_limit  # Most recent steps kept in memory per active execution
     
     async def execute_flow(
         self, 
         flow_id: str, 
         input_data: Dict[str, Any],
         framework: Optional[str] = None,
-        streaming: bool = False
+        streaming: bool = False,
+        step_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         Execute a flow with the given input data
@@ -36,6 +56,7 @@ class ExecutionService:
             input_data: Input data for the flow
             framework: Framework to use for execution (default is decided by flow)
             streaming: Whether to stream execution updates
+            step_callback: Optional callback for step updates when not streaming
             
         Returns:
             Dictionary containing execution details
@@ -95,11 +116,10 @@ class ExecutionService:
             )
             
             # Convert flow to framework-specific format
-            flow_dict = flow.to_dict()
-            framework_flow = adapter.convert_flow(flow_dict)
+            framework_flow = self._get_framework_flow(flow, adapter)
             
             # Execute flow
-            result = await adapter.execute_flow(framework_flow, input_data)
+            result = await adapter.execute_flow(framework_flow, input_data, step_callback=step_callback)
             
             # Update execution record with success
             completed_at = datetime.utcnow()
@@ -130,7 +150,7 @@ class ExecutionService:
                 "steps": steps
             }
         except Exception as e:
-            logger.exception(f"Error executing flow: {str(e)}")
+            logger.exception("Error executing flow: %s", e)
             
             # Update execution record with error
             self.execution_repository.update(
@@ -145,6 +165,117 @@ class ExecutionService:
             # Re-raise exception
             raise
     
+    async def stream_flow(
+        self,
+        flow_id: str,
+        input_data: Dict[str, Any],
+        framework: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a flow, yielding each step update as soon as the adapter emits it
+        
+        Args:
+            flow_id: ID of the flow to execute
+            input_data: Input data for the flow
+            framework: Framework to use for execution (default is decided by flow)
+            
+        Yields:
+            Step updates (including streamed "token" updates) in the order they
+            happen, followed by a final update of type "result" with the execution
+            details. Errors from the execution are raised after the last step.
+        """
+        updates = asyncio.Queue()
+        finished = object()
+        
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.execute_flow(
+                    flow_id,
+                    input_data,
+                    framework=framework,
+                    step_callback=updates.put
+                )
+            finally:
+                updates.put_nowait(finished)
+        
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                update = await updates.get()
+                if update is finished:
+                    break
+                yield update
+            
+            yield {"type": "result", **(await task)}
+        finally:
+            # Stop the execution if the consumer goes away early
+            if not task.done():
+                task.cancel()
+    
+    async def execute_flow_batch(
+        self,
+        flow_id: str,
+        inputs: List[Dict[str, Any]],
+        framework: Optional[str] = None,
+        max_concurrency: int = 4,
+        dedupe: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a flow once per input, running up to max_concurrency executions at a time
+        
+        Args:
+            flow_id: ID of the flow to execute
+            inputs: Input data for each execution
+            framework: Framework to use for execution (default is decided by flow)
+            max_concurrency: Maximum number of executions in flight
+            dedupe: Execute identical inputs only once. Only use this for
+                deterministic flows, since repeated inputs are otherwise meant
+                to produce independent samples
+            
+        Returns:
+            Execution details in the same order as inputs; failed executions
+            are reported with status "failed" and an error message. With
+            dedupe, a single execution record covers every matching input and
+            each position receives its own copy of that result.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(input_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.execute_flow(flow_id, input_data, framework=framework)
+                except Exception as e:
+                    return {
+                        "status": "failed",
+                        "flow_id": flow_id,
+                        "framework": framework,
+                        "error": str(e)
+                    }
+        
+        if not dedupe:
+            return list(await asyncio.gather(*(run_one(input_data) for input_data in inputs)))
+        
+        # Collapse identical inputs so each distinct input runs once
+        unique_inputs = []
+        input_slots = []
+        slot_by_key = {}
+        for input_data in inputs:
+            try:
+                key = json.dumps(input_data, sort_keys=True)
+            except (TypeError, ValueError):
+                key = None
+            
+            slot = slot_by_key.get(key) if key is not None else None
+            if slot is None:
+                slot = len(unique_inputs)
+                unique_inputs.append(input_data)
+                if key is not None:
+                    slot_by_key[key] = slot
+            input_slots.append(slot)
+        
+        results = await asyncio.gather(*(run_one(input_data) for input_data in unique_inputs))
+        return [copy.deepcopy(results[slot]) for slot in input_slots]
+    
     async def _execute_flow_task(
         self,
         execution_id: str,
@@ -159,7 +290,8 @@ class ExecutionService:
                 "status": "running",
                 "started_at": datetime.utcnow(),
                 "current_step": 0,
-                "current_trace": []
+                "current_trace": deque(maxlen=self.live_trace_limit),
+                "partial_output": ""
             }
             
             # Update execution status
@@ -169,15 +301,23 @@ class ExecutionService:
             )
             
             # Convert flow to framework-specific format
-            flow_dict = flow.to_dict()
-            framework_flow = adapter.convert_flow(flow_dict)
+            framework_flow = self._get_framework_flow(flow, adapter)
             
             # Prepare callback for streaming updates
             async def step_callback(step_data):
-                # Update active execution state
-                if execution_id in self._active_executions:
-                    self._active_executions[execution_id]["current_step"] += 1
-                    self._active_executions[execution_id]["current_trace"].append(step_data)
+                # Update active execution state with a single lookup
+                active_exec = self._active_executions.get(execution_id)
+                if active_exec is None:
+                    return
+                
+                # Streamed model text accumulates until the step it belongs to completes
+                if step_data.get("type") == "token":
+                    active_exec["partial_output"] += step_data["content"]
+                    return
+                
+                active_exec["current_trace"].append(step_data)
+                active_exec["current_step"] += 1
+                active_exec["partial_output"] = ""
             
             # Execute flow with streaming callback
             result = await adapter.execute_flow(
@@ -207,7 +347,7 @@ class ExecutionService:
                 del self._active_executions[execution_id]
                 
         except Exception as e:
-            logger.exception(f"Error in background execution: {str(e)}")
+            logger.exception("Error in background execution: %s", e)
             
             # Update execution record with error
             self.execution_repository.update(
@@ -223,12 +363,37 @@ class ExecutionService:
             if execution_id in self._active_executions:
                 del self._active_executions[execution_id]
     
-    async def get_execution_status(self, execution_id: str) -> Dict[str, Any]:
+    def _get_framework_flow(self, flow: Any, adapter: Any) -> Any:
+        """
+        Convert a flow for an adapter, reusing the result while the flow is unchanged
+        
+        Args:
+            flow: Flow entity
+            adapter: Framework adapter
+        
+        Returns:
+            Framework-specific flow configuration
+        """
+        cache_key = (adapter, flow.flow_id, flow.updated_at)
+        framework_flow = _converted_flows.get(cache_key)
+        if framework_flow is not None:
+            _converted_flows.move_to_end(cache_key)
+            return framework_flow
+        
+        framework_flow = adapter.convert_flow(flow.to_dict())
+        _converted_flows[cache_key] = framework_flow
+        if len(_converted_flows) > _CONVERTED_FLOWS_MAX_SIZE:
+            _converted_flows.popitem(last=False)
+        return framework_flow
+    
+    async def get_execution_status(self, execution_id: str, since_step: int = 0) -> Dict[str, Any]:
         """
         Get current status of an execution
         
         Args:
             execution_id: ID of the execution
+            since_step: For active executions, only return trace entries after this many steps
+                (entries older than the live trace limit are no longer available)
         
         Returns:
             Dictionary containing execution status
@@ -236,11 +401,17 @@ class ExecutionService:
         # First check if it's an active streaming execution
         if execution_id in self._active_executions:
             active_exec = self._active_executions[execution_id]
+            live_trace = active_exec["current_trace"]
+            
+            # The live trace only holds the most recent steps; map the cursor onto it
+            first_live_step = active_exec["current_step"] - len(live_trace)
+            skip = max(since_step - first_live_step, 0)
             return {
                 "execution_id": execution_id,
                 "status": "running",
                 "current_step": active_exec["current_step"],
-                "current_trace": active_exec["current_trace"],
+                "current_trace": list(islice(live_trace, skip, None)),
+                "partial_output": active_exec["partial_output"],
                 "streaming": True
             }
         
@@ -268,8 +439,10 @@ class ExecutionService:
         Returns:
             List of execution dictionaries
         """
-        executions = self.execution_repository.get_by_flow_id(flow_id, skip, limit)
-        return [self._convert_to_dict(execution) for execution in executions]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _query_executor, self._load_executions, self.execution_repository.get_by_flow_id, flow_id, skip, limit
+        )
     
     async def get_recent_executions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -281,8 +454,26 @@ class ExecutionService:
         Returns:
             List of execution dictionaries
         """
-        executions = self.execution_repository.get_recent_executions(limit)
-        return [self._convert_to_dict(execution) for execution in executions]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _query_executor, self._load_executions, self.execution_repository.get_recent_executions, limit
+        )
+    
+    def _load_executions(self, fetch: Callable[..., List[Any]], *args: Any) -> List[Dict[str, Any]]:
+        """
+        Query executions and convert them to dictionaries
+        
+        Runs on a worker thread: the query and the JSON decoding of every
+        result and trace would otherwise block the event loop.
+        
+        Args:
+            fetch: Repository query method
+            *args: Arguments for the query
+        
+        Returns:
+            List of execution dictionaries
+        """
+        return [self._convert_to_dict(execution) for execution in fetch(*args)]
     
     async def get_execution_stats(
         self,
@@ -114,7 +114,9 @@ class FlowValidator:
                             "system_message": {"type": "string"},
                             "temperature": {"type": "number", "minimum": 0, "maximum": 1},
                             "capabilities": {"type": "array", "items": {"type": "string"}},
-                            "tool_names": {"type": "array", "items": {"type": "string"}}
+                            "tool_names": {"type": "array", "items": {"type": "string"}},
+                            "fallback_models": {"type": "array", "items": {"type": ["string", "object"]}},
+                            "cache_responses": {"type": "boolean"}
                         }
                     }
                 },
@@ -201,7 +203,7 @@ class FlowValidator:
             return result
         
         # Check for duplicate agent IDs
-        agent_ids = []
+        agent_ids = set()
         for i, agent in enumerate(agents):
             agent_id = agent.get("agent_id")
             if not agent_id:
@@ -211,7 +213,7 @@ class FlowValidator:
                 result["valid"] = False
                 result["errors"].append(f"Duplicate agent_id '{agent_id}' found")
             else:
-                agent_ids.append(agent_id)
+                agent_ids.add(agent_id)
             
             # Check for required fields
             if not agent.get("name"):
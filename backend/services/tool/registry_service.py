@@ -1,21 +1,37 @@
 # backend/services/tool/registry_service.py
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple
 import logging
 import importlib
 import inspect
 import json
+import hashlib
+import copy
 import os
 import asyncio
-from datetime import datetime
+import time
+import functools
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only stand-in for tools registered without metadata
+_EMPTY_METADATA = MappingProxyType({})
+
 class ToolRegistry:
     """Service for registering and executing tools across frameworks"""
     
-    def __init__(self):
+    def __init__(self, result_cache_size: int = 512, max_tool_workers: int = 16):
         self._tools = {}  # Dictionary of registered tools by name
         self._functions = {}  # Dictionary of tool functions by name
+        self._async_functions = set()  # Names of tools whose function is a coroutine function
+        self._universal_tools = set()  # Tools with no framework restriction
+        self._framework_tools: Dict[str, set] = {}  # Framework name -> tools explicitly compatible with it
+        self._result_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()  # LRU of cacheable tool results
+        self._result_cache_size = result_cache_size
+        self._latency_ema: Dict[str, float] = {}  # Smoothed execution time per tool (seconds)
+        self._executor = ThreadPoolExecutor(max_workers=max_tool_workers, thread_name_prefix="tool")  # Workers for blocking tools
         self._register_default_tools()
         
     def _register_default_tools(self):
@@ -83,7 +99,9 @@ class ToolRegistry:
                 "is_enabled": True,
                 "metadata": {
                     "category": "utility",
-                    "compatible_frameworks": ["langgraph", "crewai", "autogen", "dspy"]
+                    "compatible_frameworks": ["langgraph", "crewai", "autogen", "dspy"],
+                    "cacheable": True,
+                    "run_inline": True
                 }
             })
             
@@ -102,6 +120,10 @@ class ToolRegistry:
                             "description": "Type of analysis to perform",
                             "enum": ["descriptive", "exploratory"],
                             "default": "descriptive"
+                        },
+                        "fields": {
+                            "type": "array",
+                            "description": "Only analyze these fields (default: all fields)"
                         }
                     },
                     "required": ["data"]
@@ -110,7 +132,8 @@ class ToolRegistry:
                 "is_enabled": True,
                 "metadata": {
                     "category": "data_processing",
-                    "compatible_frameworks": ["langgraph", "crewai", "autogen"]
+                    "compatible_frameworks": ["langgraph", "crewai", "autogen"],
+                    "cacheable": True
                 }
             })
             
@@ -159,6 +182,11 @@ class ToolRegistry:
                         "code": {
                             "type": "string",
                             "description": "Code to execute"
+                        },
+                        "timeout": {
+                            "type": "number",
+                            "description": "Seconds to allow the code to run (at most 10)",
+                            "default": 10
                         }
                     },
                     "required": ["language", "code"]
@@ -203,9 +231,9 @@ class ToolRegistry:
             
             logger.info("Successfully registered default tools")
         except ImportError as e:
-            logger.warning(f"Failed to import default tools: {str(e)}")
+            logger.warning("Failed to import default tools: %s", e)
         except Exception as e:
-            logger.exception(f"Error registering default tools: {str(e)}")
+            logger.exception("Error registering default tools: %s", e)
     
     def register_tool(self, tool_data: Dict[str, Any]) -> bool:
         """
@@ -224,9 +252,11 @@ class ToolRegistry:
         
         # Store tool configuration
         self._tools[tool_name] = tool_data
+        self._index_tool_frameworks(tool_name, tool_data)
+        self.invalidate_cache(tool_name)
         
         # Log successful registration
-        logger.info(f"Registered tool: {tool_name}")
+        logger.info("Registered tool: %s", tool_name)
         return True
     
     def register_function(self, tool_name: str, function: Callable) -> bool:
@@ -241,11 +271,16 @@ class ToolRegistry:
             Success status
         """
         if not callable(function):
-            logger.error(f"Cannot register non-callable object as tool function for {tool_name}")
+            logger.error("Cannot register non-callable object as tool function for %s", tool_name)
             return False
         
         self._functions[tool_name] = function
-        logger.info(f"Registered function for tool: {tool_name}")
+        if inspect.iscoroutinefunction(function):
+            self._async_functions.add(tool_name)
+        else:
+            self._async_functions.discard(tool_name)
+        self.invalidate_cache(tool_name)
+        logger.info("Registered function for tool: %s", tool_name)
         return True
     
     async def execute_tool(
@@ -265,20 +300,18 @@ class ToolRegistry:
         Returns:
             Execution result
         """
-        # Check if tool exists
-        if tool_name not in self._tools:
-            logger.error(f"Tool '{tool_name}' not found in registry")
+        # Get tool configuration
+        tool_config = self._tools.get(tool_name)
+        if tool_config is None:
+            logger.error("Tool '%s' not found in registry", tool_name)
             return {
                 "error": f"Tool '{tool_name}' not found",
                 "status": "error"
             }
         
-        # Get tool configuration
-        tool_config = self._tools[tool_name]
-        
         # Check if tool is enabled
         if not tool_config.get("is_enabled", True):
-            logger.warning(f"Attempted to execute disabled tool '{tool_name}'")
+            logger.warning("Attempted to execute disabled tool '%s'", tool_name)
             return {
                 "error": f"Tool '{tool_name}' is disabled",
                 "status": "error"
@@ -287,48 +320,148 @@ class ToolRegistry:
         # Check if function is available
         func = self._functions.get(tool_name)
         if not func:
-            logger.error(f"No function available for tool '{tool_name}'")
+            logger.error("No function available for tool '%s'", tool_name)
             return {
                 "error": f"Tool '{tool_name}' has no implementation",
                 "status": "error"
             }
         
+        metadata = tool_config.get("metadata") or _EMPTY_METADATA
+        
+        # Serve pure tools from the result cache when the same call repeats
+        cache_key = None
+        if context is None and metadata.get("cacheable"):
+            cache_key = self._make_cache_key(tool_name, parameters)
+            if cache_key is not None:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    # Each caller gets its own copy so nested results aren't shared
+                    return {**copy.deepcopy(cached), "cached": True}
+        
         # Execute the function
         try:
-            start_time = datetime.now()
+            # Only pass a context to tools when one was given
+            call_kwargs = {} if context is None else {"context": context}
+            
+            start_time = time.perf_counter()
             
-            # Check if function is async
-            if inspect.iscoroutinefunction(func):
+            # Check if function is async (decided once at registration)
+            if tool_name in self._async_functions:
                 # Execute async function
-                if context is not None:
-                    result = await func(parameters, context=context)
-                else:
-                    result = await func(parameters)
+                result = await func(parameters, **call_kwargs)
+            elif metadata.get("run_inline"):
+                # Cheap synchronous tools run directly, skipping the worker thread hop
+                result = func(parameters, **call_kwargs)
             else:
-                # Execute regular function (wrap in asyncio task)
-                if context is not None:
-                    result = await asyncio.to_thread(func, parameters, context=context)
-                else:
-                    result = await asyncio.to_thread(func, parameters)
+                # Execute regular function on the registry's own worker pool
+                result = await self.run_blocking(func, parameters, **call_kwargs)
                     
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
+            self._record_latency(tool_name, execution_time)
             
             # Format the result
-            return {
+            tool_result = {
                 "result": result,
                 "tool": tool_name,
                 "execution_time": execution_time,
                 "status": "success"
             }
             
+            if cache_key is not None:
+                self._result_cache[cache_key] = copy.deepcopy(tool_result)
+                if len(self._result_cache) > self._result_cache_size:
+                    self._result_cache.popitem(last=False)
+            
+            return tool_result
+            
         except Exception as e:
-            logger.exception(f"Error executing tool '{tool_name}': {str(e)}")
+            logger.exception("Error executing tool '%s': %s", tool_name, e)
             return {
                 "error": str(e),
                 "tool": tool_name,
                 "status": "error"
             }
     
+    async def run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking tool implementation on the registry's worker pool
+        
+        Args:
+            func: Synchronous function to call
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            The function's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    def _record_latency(self, tool_name: str, execution_time: float, alpha: float = 0.2) -> None:
+        """
+        Update the smoothed execution time for a tool
+        
+        Args:
+            tool_name: Name of the tool
+            execution_time: Observed execution time in seconds
+            alpha: Weight of the new observation
+        """
+        previous = self._latency_ema.get(tool_name)
+        if previous is None:
+            self._latency_ema[tool_name] = execution_time
+        else:
+            self._latency_ema[tool_name] = previous + alpha * (execution_time - previous)
+    
+    def get_expected_latency(self, tool_name: str) -> float:
+        """
+        Get the expected execution time for a tool
+        
+        Args:
+            tool_name: Name of the tool
+            
+        Returns:
+            Smoothed execution time in seconds (0.0 if never executed)
+        """
+        return self._latency_ema.get(tool_name, 0.0)
+    
+    def _make_cache_key(self, tool_name: str, parameters: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Build a stable cache key for a tool invocation
+        
+        Args:
+            tool_name: Name of the tool
+            parameters: Parameters for the tool
+            
+        Returns:
+            Cache key (tool name and digest of the parameters), or None if the
+            parameters cannot be serialized
+        """
+        try:
+            serialized = json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+        # Keep only a digest so large inputs aren't held in memory by the cache
+        return tool_name, hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    
+    def invalidate_cache(self, tool_name: Optional[str] = None) -> None:
+        """
+        Drop cached tool results
+        
+        Args:
+            tool_name: Only drop results for this tool (all tools if None)
+        """
+        if tool_name is None:
+            self._result_cache.clear()
+            return
+        
+        for key in [key for key in self._result_cache if key[0] == tool_name]:
+            del self._result_cache[key]
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool used for blocking tools"""
+        self._executor.shutdown(wait=False)
+    
     def get_all_tools(self) -> List[Dict[str, Any]]:
         """
         Get all registered tools
@@ -351,10 +484,10 @@ class ToolRegistry:
         Returns:
             Tool configuration or None if not found
         """
-        if tool_name not in self._tools:
+        config = self._tools.get(tool_name)
+        if config is None:
             return None
             
-        config = self._tools[tool_name]
         return {
             **config, 
             "has_implementation": tool_name in self._functions
@@ -370,29 +503,33 @@ class ToolRegistry:
         Returns:
             List of compatible tool configurations
         """
+        framework_tools = self._framework_tools.get(framework, ())
         return [
-            {**config, "has_implementation": config.get("name") in self._functions}
-            for config in self._tools.values()
-            if self._is_tool_compatible_with_framework(config, framework)
+            {**config, "has_implementation": tool_name in self._functions}
+            for tool_name, config in self._tools.items()
+            if tool_name in self._universal_tools or tool_name in framework_tools
         ]
     
-    def _is_tool_compatible_with_framework(self, tool_config: Dict[str, Any], framework: str) -> bool:
+    def _index_tool_frameworks(self, tool_name: str, tool_config: Dict[str, Any]) -> None:
         """
-        Check if a tool is compatible with a framework
+        Record which frameworks a tool is compatible with
         
         Args:
+            tool_name: Name of the tool
             tool_config: Tool configuration
-            framework: Framework name
-            
-        Returns:
-            True if compatible, False otherwise
         """
-        # If tool has no specific framework compatibility, assume it's compatible with all
-        if not tool_config.get("metadata", {}).get("compatible_frameworks"):
-            return True
-            
-        # Check if framework is in the compatible_frameworks list
-        return framework in tool_config.get("metadata", {}).get("compatible_frameworks", [])
+        # Drop any entries from a previous registration of the same tool
+        self._universal_tools.discard(tool_name)
+        for tool_names in self._framework_tools.values():
+            tool_names.discard(tool_name)
+        
+        compatible_frameworks = (tool_config.get("metadata") or _EMPTY_METADATA).get("compatible_frameworks")
+        if not compatible_frameworks:
+            self._universal_tools.add(tool_name)
+            return
+        
+        for framework in compatible_frameworks:
+            self._framework_tools.setdefault(framework, set()).add(tool_name)
     
     def get_tools_by_category(self, category: str) -> List[Dict[str, Any]]:
         """
@@ -407,7 +544,7 @@ class ToolRegistry:
         return [
             {**config, "has_implementation": config.get("name") in self._functions}
             for config in self._tools.values()
-            if config.get("metadata", {}).get("category") == category
+            if (config.get("metadata") or _EMPTY_METADATA).get("category") == category
         ]
     
     def get_disabled_tools(self) -> List[Dict[str, Any]]:
@@ -4,18 +4,31 @@ import json
 import logging
 import importlib
 import inspect
-from datetime import datetime
+import time
 
 from ...db.repositories.tool_repository import ToolRepository
+from .registry_service import get_tool_registry
 
 logger = logging.getLogger(__name__)
 
+# JSON Schema type -> (accepted Python types, description used in validation errors)
+_SCHEMA_TYPES = {
+    'string': (str, "a string"),
+    'number': ((int, float), "a number"),
+    'integer': (int, "an integer"),
+    'boolean': (bool, "a boolean"),
+    'array': (list, "an array"),
+    'object': (dict, "an object")
+}
+
 class ToolService:
     """Service for managing tools and their configurations"""
     
     def __init__(self, tool_repository: ToolRepository):
         self.tool_repository = tool_repository
         self._tool_cache = {}  # Cache loaded tool implementations
+        self._accepts_context = {}  # Cache whether each loaded implementation takes a context
+        self._is_coroutine = {}  # Cache whether each loaded implementation is a coroutine function
     
     async def get_all_tools(
         self, 
@@ -43,11 +56,7 @@ class ToolService:
         
         # Apply framework filter if specified
         if framework:
-            tool_dicts = [
-                tool for tool in tool_dicts 
-                if not tool.get('metadata', {}).get('compatible_frameworks') or
-                framework in tool.get('metadata', {}).get('compatible_frameworks', [])
-            ]
+            tool_dicts = [tool for tool in tool_dicts if self._is_compatible(tool, framework)]
             
         return tool_dicts
     
@@ -205,7 +214,7 @@ class ToolService:
             return func
             
         except (ImportError, AttributeError) as e:
-            logger.error(f"Error loading tool implementation for {tool_name}: {str(e)}")
+            logger.error("Error loading tool implementation for %s: %s", tool_name, e)
             return None
     
     async def execute_tool(
@@ -247,17 +256,22 @@ class ToolService:
         
         try:
             # Execute the tool
-            start_time = datetime.utcnow()
+            start_time = time.perf_counter()
             
-            # Check if function accepts context
-            sig = inspect.signature(func)
-            if 'context' in sig.parameters:
-                result = func(params, context=execution_context)
+            # Check if function accepts context and is async (inspected once per function)
+            accepts_context = self._accepts_context.get(func)
+            if accepts_context is None:
+                accepts_context = 'context' in inspect.signature(func).parameters
+                self._accepts_context[func] = accepts_context
+                self._is_coroutine[func] = inspect.iscoroutinefunction(func)
+            call_kwargs = {"context": execution_context} if accepts_context else {}
+            if self._is_coroutine[func]:
+                result = await func(params, **call_kwargs)
             else:
-                result = func(params)
+                # Run blocking implementations on the tool registry's worker pool
+                result = await get_tool_registry().run_blocking(func, params, **call_kwargs)
                 
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             # Format response
             return {
@@ -267,7 +281,7 @@ class ToolService:
                 "status": "success"
             }
         except Exception as e:
-            logger.exception(f"Error executing tool {tool_name}: {str(e)}")
+            logger.exception("Error executing tool %s: %s", tool_name, e)
             return {
                 "error": str(e),
                 "tool": tool_name,
@@ -295,19 +309,22 @@ class ToolService:
         # Filter by framework compatibility and enabled status
         filtered_tools = []
         for tool in tools:
-            tool_dict = self._convert_to_dict(tool)
-            
-            # Check if enabled (if filter is on)
+            # Check if enabled (if filter is on) before paying for the conversion
             if enabled_only and not tool.is_enabled:
                 continue
-                
+            
             # Check framework compatibility
-            compatible_frameworks = tool_dict.get('metadata', {}).get('compatible_frameworks', [])
-            if not compatible_frameworks or framework in compatible_frameworks:
+            tool_dict = self._convert_to_dict(tool)
+            if self._is_compatible(tool_dict, framework):
                 filtered_tools.append(tool_dict)
                 
         return filtered_tools
         
+    def _is_compatible(self, tool_dict: Dict[str, Any], framework: str) -> bool:
+        """Check whether a converted tool can be used with a framework (no restriction means any)"""
+        compatible_frameworks = (tool_dict.get('metadata') or {}).get('compatible_frameworks')
+        return not compatible_frameworks or framework in compatible_frameworks
+    
     def _validate_tool_data(self, tool_data: Dict[str, Any]) -> None:
         """
         Validate tool data for creation or update
@@ -365,27 +382,14 @@ class ToolService:
         # Check parameter types (basic)
         properties = schema.get('properties', {})
         for param_name, param_value in params.items():
-            if param_name in properties:
-                param_schema = properties[param_name]
-                param_type = param_schema.get('type')
-                
-                if param_type == 'string' and not isinstance(param_value, str):
-                    raise ValueError(f"Parameter '{param_name}' must be a string")
-                    
-                elif param_type == 'number' and not isinstance(param_value, (int, float)):
-                    raise ValueError(f"Parameter '{param_name}' must be a number")
-                    
-                elif param_type == 'integer' and not isinstance(param_value, int):
-                    raise ValueError(f"Parameter '{param_name}' must be an integer")
-                    
-                elif param_type == 'boolean' and not isinstance(param_value, bool):
-                    raise ValueError(f"Parameter '{param_name}' must be a boolean")
-                    
-                elif param_type == 'array' and not isinstance(param_value, list):
-                    raise ValueError(f"Parameter '{param_name}' must be an array")
-                    
-                elif param_type == 'object' and not isinstance(param_value, dict):
-                    raise ValueError(f"Parameter '{param_name}' must be an object")
+            param_schema = properties.get(param_name)
+            if param_schema is None:
+                continue
+            
+            # Look up the expected type once instead of testing each type in turn
+            expected = _SCHEMA_TYPES.get(param_schema.get('type'))
+            if expected is not None and not isinstance(param_value, expected[0]):
+                raise ValueError(f"Parameter '{param_name}' must be {expected[1]}")
     
     def _convert_to_dict(self, tool) -> Dict[str, Any]:
         """Convert tool model to dictionary"""
@@ -428,4 +432,6 @@ class ToolService:
             tool_name: Name of the tool to clear from cache
         """
         if tool_name in self._tool_cache:
-            del self._tool_cache[tool_name]
+            func = self._tool_cache.pop(tool_name)
+            self._accepts_context.pop(func, None)
+            self._is_coroutine.pop(func, None)
@@ -3,7 +3,8 @@ import os
 import sys
 import pytest
 import asyncio
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Add parent directory to path so we can import backend modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -147,6 +148,22 @@ class TestLangGraphAdapter:
         assert web_search_tool["description"] == "Search the web"
         assert web_search_tool["langgraph_config"]["async_execution"] is True
     
+    def test_convert_flow_without_agent_id(self):
+        adapter = LangGraphAdapter()
+        
+        # API-created flows store agent_id as None when the client leaves it out
+        flow_data = {
+            "name": "Test Flow",
+            "agents": [
+                {"agent_id": None, "name": "Agent 1"},
+                {"agent_id": "agent-x", "name": "Agent 2"}
+            ]
+        }
+        
+        converted_flow = adapter.convert_flow(flow_data)
+        
+        assert [agent["id"] for agent in converted_flow["agents"]] == ["agent-0", "agent-x"]
+    
     @pytest.mark.asyncio
     async def test_execute_flow(self):
         adapter = LangGraphAdapter()
@@ -256,6 +273,95 @@ class TestLangGraphAdapter:
         assert data_analysis["description"] == "Analyze data"
         assert data_analysis["langgraph_config"]["async_execution"] is False
         assert data_analysis["langgraph_config"]["streaming"] is True
+    
+    def test_response_cache_only_for_deterministic_calls(self):
+        adapter = LangGraphAdapter()
+        
+        agent_config = {
+            "model_provider": "openai",
+            "model_name": "gpt-4",
+            "temperature": 0,
+            "tools": ["web_search"]
+        }
+        messages = [SimpleNamespace(type="human", name=None, content="What is 2 + 2?")]
+        
+        # Identical deterministic requests share a key
+        cache_key = adapter._make_response_cache_key(agent_config, messages)
+        assert cache_key is not None
+        assert cache_key == adapter._make_response_cache_key(dict(agent_config), messages)
+        
+        # Whitespace differences don't defeat the cache
+        reformatted = [SimpleNamespace(type="human", name=None, content="  What is 2 +\n2? ")]
+        assert cache_key == adapter._make_response_cache_key(agent_config, reformatted)
+        
+        response = MagicMock()
+        adapter._cache_response(cache_key, response)
+        assert adapter._get_cached_response(cache_key) is response
+        
+        # Sampled requests are only cached when the agent opts in
+        sampled_config = {**agent_config, "temperature": 0.7}
+        assert adapter._make_response_cache_key(sampled_config, messages) is None
+        sampled_key = adapter._make_response_cache_key({**sampled_config, "cache_responses": True}, messages)
+        assert sampled_key is not None
+        assert sampled_key != cache_key
+        
+        # Expired entries are dropped
+        expiring_adapter = LangGraphAdapter(response_cache_ttl=0)
+        expiring_adapter._cache_response(cache_key, response)
+        assert expiring_adapter._get_cached_response(cache_key) is None
+    
+    def test_normalize_content_keeps_indentation(self):
+        normalize = LangGraphAdapter._normalize_content
+        
+        # Outer whitespace and trailing spaces on each line are ignored
+        assert normalize("  if a:   \n    b()  \n") == "if a:\n    b()"
+        
+        # Indentation and line breaks still distinguish prompts
+        assert normalize("if a:\n    b()\nc()") != normalize("if a:\n    b()\n    c()")
+        assert normalize("a b") != normalize("a\nb")
+    
+    @pytest.mark.asyncio
+    async def test_invoke_llm_retries_rate_limits(self):
+        adapter = LangGraphAdapter(max_llm_retries=2)
+        
+        class RateLimitError(Exception):
+            pass
+        
+        response = MagicMock()
+        chain = MagicMock()
+        chain.ainvoke = AsyncMock(side_effect=[RateLimitError("slow down"), response])
+        
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            result = await adapter._invoke_llm(chain, [])
+        
+        assert result is response
+        assert chain.ainvoke.call_count == 2
+        assert mock_sleep.call_count == 1
+        
+        # Other errors are not retried
+        chain.ainvoke = AsyncMock(side_effect=ValueError("bad request"))
+        with pytest.raises(ValueError):
+            await adapter._invoke_llm(chain, [])
+        assert chain.ainvoke.call_count == 1
+
+    
+    def test_tool_result_content_is_truncated(self):
+        adapter = LangGraphAdapter(max_tool_result_chars=20)
+        
+        # Short results are passed through unchanged
+        assert adapter._tool_result_content({"ok": 1}) == '{"ok":1}'
+        
+        # Long results are cut to the limit and marked
+        content = adapter._tool_result_content({"result": "x" * 100})
+        assert content.endswith("...[truncated]")
+        assert len(content) == 20 + len(" ...[truncated]")
+    
+    def test_tool_result_content_handles_values_orjson_rejects(self):
+        adapter = LangGraphAdapter()
+        
+        # Integers beyond 64 bits and non-str keys still serialize
+        assert adapter._tool_result_content({"result": 2**100}) == '{"result":%d}' % 2**100
+        assert adapter._tool_result_content({"top_categories": {1: 2}}) == '{"top_categories":{"1":2}}'
 
 
 class TestCrewAIAdapter:
@@ -306,6 +412,10 @@ class TestCrewAIAdapter:
                     "config": {
                         "allow_delegation": False
                     }
+                },
+                "translation": {
+                    "description": "Translate text",
+                    "config": {}
                 }
             },
             "max_steps": 5
@@ -321,6 +431,7 @@ class TestCrewAIAdapter:
         assert "tools" in converted_flow
         assert "web_search" in converted_flow["tools"]
         assert "data_analysis" in converted_flow["tools"]
+        assert "translation" not in converted_flow["tools"]  # Not used by any agent
         assert converted_flow["max_steps"] == 5
         
         # Verify agent conversion
@@ -340,6 +451,22 @@ class TestCrewAIAdapter:
         assert data_analysis_tool["description"] == "Analyze data"
         assert data_analysis_tool["crewai_config"]["allow_delegation"] is False
     
+    def test_convert_flow_without_agent_id(self):
+        adapter = CrewAIAdapter()
+        
+        # API-created flows store agent_id as None when the client leaves it out
+        flow_data = {
+            "name": "Test Flow",
+            "agents": [
+                {"agent_id": None, "name": "Agent 1"},
+                {"agent_id": "agent-x", "name": "Agent 2"}
+            ]
+        }
+        
+        converted_flow = adapter.convert_flow(flow_data)
+        
+        assert [agent["id"] for agent in converted_flow["agents"]] == ["agent-0", "agent-x"]
+    
     @pytest.mark.asyncio
     async def test_execute_flow(self):
         adapter = CrewAIAdapter()
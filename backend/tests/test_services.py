@@ -13,6 +13,7 @@ from backend.core.entities.flow import Flow
 from backend.services.flow.flow_service import FlowService
 from backend.services.execution.execution_service import ExecutionService
 from backend.services.tool.tool_service import ToolService
+from backend.services.tool.registry_service import ToolRegistry
 from backend.services.deployment.deployment_service import DeploymentService
 
 
@@ -279,6 +280,85 @@ class TestExecutionService:
         assert mock_adapter.convert_flow.called
         assert mock_adapter.execute_flow.called
 
+    @pytest.mark.asyncio
+    async def test_execute_flow_batch(self):
+        execution_service = ExecutionService(
+            flow_repository=MagicMock(),
+            execution_repository=MagicMock()
+        )
+        
+        async def fake_execute_flow(flow_id, input_data, framework=None):
+            if input_data["query"] == "bad":
+                raise ValueError("boom")
+            return {"status": "completed", "result": {"output": {"content": input_data["query"]}}}
+        
+        execution_service.execute_flow = fake_execute_flow
+        
+        results = await execution_service.execute_flow_batch(
+            "test-flow-id",
+            [{"query": "a"}, {"query": "bad"}, {"query": "b"}],
+            max_concurrency=2
+        )
+        
+        # Results keep input order and failures don't abort the batch
+        assert [r["status"] for r in results] == ["completed", "failed", "completed"]
+        assert results[0]["result"]["output"]["content"] == "a"
+        assert results[1]["error"] == "boom"
+        assert results[2]["result"]["output"]["content"] == "b"
+        
+        # Identical inputs run separately unless dedupe is requested
+        calls = []
+        
+        async def counting_execute_flow(flow_id, input_data, framework=None):
+            calls.append(input_data)
+            return {"status": "completed", "result": {"output": {"content": input_data["query"]}}}
+        
+        execution_service.execute_flow = counting_execute_flow
+        
+        batch = [{"query": "a"}, {"query": "a"}, {"query": "b"}]
+        
+        results = await execution_service.execute_flow_batch("test-flow-id", batch)
+        
+        assert len(calls) == 3
+        
+        calls.clear()
+        results = await execution_service.execute_flow_batch("test-flow-id", batch, dedupe=True)
+        
+        assert len(calls) == 2
+        assert [r["result"]["output"]["content"] for r in results] == ["a", "a", "b"]
+        assert results[0] is not results[1]
+        assert results[0]["result"] is not results[1]["result"]
+
+    @pytest.mark.asyncio
+    async def test_stream_flow(self):
+        execution_service = ExecutionService(
+            flow_repository=MagicMock(),
+            execution_repository=MagicMock()
+        )
+        
+        async def fake_execute_flow(flow_id, input_data, framework=None, step_callback=None):
+            await step_callback({"type": "token", "content": "Hel"})
+            await step_callback({"step": 1, "type": "agent_execution"})
+            return {"execution_id": "test-execution-id", "status": "completed"}
+        
+        execution_service.execute_flow = fake_execute_flow
+        
+        updates = [update async for update in execution_service.stream_flow("test-flow-id", {"query": "hi"})]
+        
+        # Steps arrive in order, followed by the final result
+        assert [update["type"] for update in updates] == ["token", "agent_execution", "result"]
+        assert updates[-1]["status"] == "completed"
+        
+        # Execution errors surface to the consumer
+        async def failing_execute_flow(flow_id, input_data, framework=None, step_callback=None):
+            raise ValueError("boom")
+        
+        execution_service.execute_flow = failing_execute_flow
+        
+        with pytest.raises(ValueError):
+            async for _ in execution_service.stream_flow("test-flow-id", {"query": "hi"}):
+                pass
+
     @pytest.mark.asyncio
     async def test_get_execution_status(self):
         # Mock repository
@@ -498,6 +578,45 @@ class TestToolService:
         assert len(all_langgraph_tools) == 3  # Should include the disabled tool
 
 
+class TestToolRegistry:
+    @pytest.mark.asyncio
+    async def test_execute_tool_caches_pure_results(self):
+        registry = ToolRegistry()
+        
+        # Register a pure tool and a regular tool backed by the same mock
+        mock_function = MagicMock(return_value={"value": 42})
+        registry.register_function("pure_tool", mock_function)
+        registry.register_tool({"name": "pure_tool", "metadata": {"cacheable": True}})
+        registry.register_function("plain_tool", mock_function)
+        registry.register_tool({"name": "plain_tool"})
+        
+        params = {"x": 1, "y": 2}
+        first = await registry.execute_tool("pure_tool", params)
+        second = await registry.execute_tool("pure_tool", {"y": 2, "x": 1})
+        
+        # Verify the second call was served from the cache
+        assert first["status"] == "success"
+        assert second["result"] == first["result"]
+        assert second["cached"] is True
+        assert mock_function.call_count == 1
+        
+        # Callers get independent copies of cached results
+        second["result"]["value"] = 0
+        third = await registry.execute_tool("pure_tool", params)
+        assert third["result"] == {"value": 42}
+        assert first["result"] == {"value": 42}
+        
+        # Non-cacheable tools always run
+        await registry.execute_tool("plain_tool", params)
+        await registry.execute_tool("plain_tool", params)
+        assert mock_function.call_count == 3
+        
+        # Invalidation forces a re-run
+        registry.invalidate_cache("pure_tool")
+        await registry.execute_tool("pure_tool", params)
+        assert mock_function.call_count == 4
+
+
 class TestDeploymentService:
     @pytest.mark.asyncio
     async def test_deploy_flow(self):
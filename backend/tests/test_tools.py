@@ -0,0 +1,93 @@
+# backend/tests/test_tools.py
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+# Add parent directory to path so we can import backend modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.tools.default_tools import code_execution, data_analysis
+
+
+class TestCodeExecution:
+    def test_rejects_non_positive_timeout(self):
+        for timeout in (0, -1, float("nan")):
+            with pytest.raises(ValueError):
+                code_execution({"language": "python", "code": "print(1)", "timeout": timeout})
+
+    @patch.dict(os.environ, {"ALLOW_CODE_EXECUTION": "true", "USE_MOCK_TOOLS": "false"})
+    def test_timeout(self):
+        # Snippets finishing within the timeout run normally
+        result = code_execution({"language": "python", "code": "print('hello')", "timeout": 5})
+        assert result["success"] is True
+        assert result["output"].strip() == "hello"
+        
+        # Slow snippets are stopped once the timeout passes
+        result = code_execution({
+            "language": "python",
+            "code": "import time\ntime.sleep(5)",
+            "timeout": 0.5
+        })
+        assert result["success"] is False
+        assert result["error"] == "Timeout"
+        assert result["output"] == "Execution timed out after 0.5 seconds"
+        
+        # Timeouts above the limit are accepted and capped rather than rejected
+        result = code_execution({"language": "python", "code": "print(1)", "timeout": 60})
+        assert result["success"] is True
+
+
+class TestDataAnalysis:
+    def test_boolean_fields(self):
+        data = [
+            {"score": 1, "active": True},
+            {"score": 3, "active": False}
+        ]
+        
+        # Booleans are not treated as numbers
+        result = data_analysis({"data": data})
+        assert result["numeric_fields"] == ["score"]
+        assert "active" not in result["statistics"]
+        
+        # They are reported as their own field type
+        result = data_analysis({"data": data, "analysis_type": "exploratory"})
+        assert result["field_types"] == {"score": "numeric", "active": "boolean"}
+
+    def test_missing_values(self):
+        data = [
+            {"score": 1},
+            {"score": None},
+            {"score": 3},
+            {"other": "x"}
+        ]
+        
+        result = data_analysis({"data": data})
+        stats = result["statistics"]["score"]
+        assert stats["count"] == 2
+        assert stats["missing"] == 2
+        assert stats["mean"] == 2
+        assert stats["median"] == 2
+
+    def test_field_selection(self):
+        data = [
+            {"a": 1, "b": 2, "name": "x"},
+            {"a": 2, "b": 4, "name": "y"},
+            {"a": 3, "b": 7, "name": "x"}
+        ]
+        
+        # All fields are analyzed by default
+        result = data_analysis({"data": data, "analysis_type": "exploratory"})
+        assert result["numeric_fields"] == ["a", "b"]
+        assert "a:b" in result["correlations"]
+        
+        # Only the selected fields are analyzed
+        result = data_analysis({"data": data, "analysis_type": "exploratory", "fields": ["a", "name"]})
+        assert result["numeric_fields"] == ["a"]
+        assert set(result["statistics"]) == {"a"}
+        assert result["field_types"] == {"a": "numeric", "name": "string"}
+        assert result["category_stats"]["name"]["top_categories"] == {"x": 2, "y": 1}
+        assert result["correlations"] == {}
+        
+        with pytest.raises(ValueError):
+            data_analysis({"data": data, "fields": "a"})
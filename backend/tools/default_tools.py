@@ -3,16 +3,64 @@
 Default tools that can be used by agents in any framework
 """
 
+import ast
 import json
 import logging
+import math
+import functools
 import requests
+import shutil
+import subprocess
+import tempfile
+from urllib3.util.retry import Retry
 import time
+from collections import Counter
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import os
 
 logger = logging.getLogger(__name__)
 
+# HTTP session shared by tools that call external APIs, so connections are kept alive
+_http_session: Optional[requests.Session] = None
+
+def _get_http_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use"""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        # Retry throttled API calls with exponential backoff. The tools POST to paid
+        # provider APIs, so only retry when the request was certainly not processed:
+        # a 429 or a failed connect. Gateway errors and read timeouts are not retried.
+        retries = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=(429,),
+            allowed_methods=None,
+            respect_retry_after_header=True
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+@functools.lru_cache(maxsize=16)
+def _api_headers(api_key: str) -> Dict[str, str]:
+    """Build the JSON API request headers for an API key once and reuse them"""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+
+def close_http_session() -> None:
+    """Close the shared HTTP session"""
+    global _http_session
+    if _http_session is not None:
+        _http_session.close()
+        _http_session = None
+
 def web_search(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Search the web for information
@@ -36,9 +84,12 @@ def web_search(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None)
     use_mock = os.environ.get('USE_MOCK_TOOLS', 'false').lower() == 'true'
     search_api_key = os.environ.get('SEARCH_API_KEY')
     
-    if use_mock:
+    if not use_mock and not search_api_key:
+        logger.warning("No search API key configured, using mock response")
+    
+    if use_mock or not search_api_key:
         # Mock implementation for development/testing
-        logger.info(f"[MOCK] Web search for: {query}")
+        logger.info("[MOCK] Web search for: %s", query)
         time.sleep(1)  # Simulate API delay
         
         mock_results = [
@@ -74,26 +125,18 @@ def web_search(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None)
             "query": query
         }
     
-    elif not search_api_key:
-        logger.warning("No search API key configured, using mock response")
-        # Fall back to mock implementation
-        return web_search(params, context)
-    
     else:
         # Real implementation using a search API
         try:
             # Example using a generic search API (replace with your preferred provider)
             api_url = "https://api.search-provider.com/search"
-            headers = {
-                "Authorization": f"Bearer {search_api_key}",
-                "Content-Type": "application/json"
-            }
+            headers = _api_headers(search_api_key)
             payload = {
                 "q": query,
                 "limit": num_results
             }
             
-            response = requests.post(api_url, headers=headers, json=payload)
+            response = _get_http_session().post(api_url, headers=headers, json=payload)
             response.raise_for_status()
             
             # Parse response (adjust based on actual API response format)
@@ -106,9 +149,37 @@ def web_search(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None)
             }
             
         except Exception as e:
-            logger.exception(f"Error in web search: {str(e)}")
+            logger.exception("Error in web search: %s", e)
             raise ValueError(f"Search failed: {str(e)}")
 
+# Allowed names/functions for calculate(), built once at import
+_CALCULATE_NAMES = {
+    'abs': abs,
+    'round': round,
+    'min': min,
+    'max': max,
+    'sum': sum,
+    'pow': pow,
+    # Math module functions
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'sqrt': math.sqrt,
+    'log': math.log,
+    'log10': math.log10,
+    'exp': math.exp,
+    'floor': math.floor,
+    'ceil': math.ceil,
+    # Constants
+    'pi': math.pi,
+    'e': math.e
+}
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str):
+    """Compile a calculate() expression once and reuse the code object"""
+    return compile(expression, "<expression>", "eval")
+
 def calculate(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Perform calculations
@@ -129,40 +200,17 @@ def calculate(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None)
     try:
         # Very basic implementation for simple calculations only
         # For a production version, use a proper safe math evaluation library
-        import math
-        
-        # Define allowed names/functions
-        allowed_names = {
-            'abs': abs,
-            'round': round,
-            'min': min,
-            'max': max,
-            'sum': sum,
-            'pow': pow,
-            # Math module functions
-            'sin': math.sin,
-            'cos': math.cos,
-            'tan': math.tan,
-            'sqrt': math.sqrt,
-            'log': math.log,
-            'log10': math.log10,
-            'exp': math.exp,
-            'floor': math.floor,
-            'ceil': math.ceil,
-            # Constants
-            'pi': math.pi,
-            'e': math.e
-        }
+        code = _compile_expression(expression)
         
-        # Use restricted environment for eval
-        result = eval(expression, {"__builtins__": {}}, allowed_names)
+        # Use restricted environment for eval (names copied so expressions can't rebind them)
+        result = eval(code, {"__builtins__": {}}, dict(_CALCULATE_NAMES))
         
         return {
             "expression": expression,
             "result": result
         }
     except Exception as e:
-        logger.exception(f"Error in calculation: {str(e)}")
+        logger.exception("Error in calculation: %s", e)
         raise ValueError(f"Calculation failed: {str(e)}")
 
 def document_retrieval(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -189,55 +237,53 @@ def document_retrieval(params: Dict[str, Any], context: Optional[Dict[str, Any]]
     # Mock implementation for development/testing
     use_mock = os.environ.get('USE_MOCK_TOOLS', 'false').lower() == 'true'
     
-    if use_mock:
-        logger.info(f"[MOCK] Document retrieval - Query: {query}, Collection: {collection}")
-        time.sleep(1)  # Simulate API delay
-        
-        mock_docs = [
-            {
-                "id": "doc-1",
-                "title": f"Document about {query}",
-                "content": f"This document contains information about {query}. It discusses key concepts and provides examples.",
-                "metadata": {
-                    "source": "knowledge_base",
-                    "created_at": "2024-01-15T10:30:00Z",
-                    "collection": collection
-                }
-            },
-            {
-                "id": "doc-2",
-                "title": f"Understanding {query}",
-                "content": f"A comprehensive guide to understanding {query} and related concepts. This document provides in-depth explanations and case studies.",
-                "metadata": {
-                    "source": "knowledge_base",
-                    "created_at": "2024-02-20T14:45:00Z",
-                    "collection": collection
-                }
-            },
-            {
-                "id": "doc-3",
-                "title": f"Best practices for {query}",
-                "content": f"Learn about best practices and recommended approaches for working with {query}. This guide includes tips, tricks, and common pitfalls to avoid.",
-                "metadata": {
-                    "source": "knowledge_base",
-                    "created_at": "2024-03-10T09:15:00Z",
-                    "collection": collection
-                }
+    if not use_mock:
+        # In a real implementation, connect to a vector database or knowledge base
+        # Until then, fall through to the mock data
+        logger.warning("Real document retrieval not implemented, using mock data")
+    
+    logger.info("[MOCK] Document retrieval - Query: %s, Collection: %s", query, collection)
+    time.sleep(1)  # Simulate API delay
+    
+    mock_docs = [
+        {
+            "id": "doc-1",
+            "title": f"Document about {query}",
+            "content": f"This document contains information about {query}. It discusses key concepts and provides examples.",
+            "metadata": {
+                "source": "knowledge_base",
+                "created_at": "2024-01-15T10:30:00Z",
+                "collection": collection
+            }
+        },
+        {
+            "id": "doc-2",
+            "title": f"Understanding {query}",
+            "content": f"A comprehensive guide to understanding {query} and related concepts. This document provides in-depth explanations and case studies.",
+            "metadata": {
+                "source": "knowledge_base",
+                "created_at": "2024-02-20T14:45:00Z",
+                "collection": collection
+            }
+        },
+        {
+            "id": "doc-3",
+            "title": f"Best practices for {query}",
+            "content": f"Learn about best practices and recommended approaches for working with {query}. This guide includes tips, tricks, and common pitfalls to avoid.",
+            "metadata": {
+                "source": "knowledge_base",
+                "created_at": "2024-03-10T09:15:00Z",
+                "collection": collection
             }
-        ]
-        
-        return {
-            "query": query,
-            "collection": collection,
-            "documents": mock_docs[:limit],
-            "total": len(mock_docs)
         }
+    ]
     
-    else:
-        # In a real implementation, connect to a vector database or knowledge base
-        # This is a placeholder for the actual implementation
-        logger.warning("Real document retrieval not implemented, using mock data")
-        return document_retrieval(params, context)
+    return {
+        "query": query,
+        "collection": collection,
+        "documents": mock_docs[:limit],
+        "total": len(mock_docs)
+    }
 
 def data_analysis(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -247,6 +293,7 @@ def data_analysis(params: Dict[str, Any], context: Optional[Dict[str, Any]] = No
         params:
             data (List[Dict]): Data to analyze
             analysis_type (str): Type of analysis to perform
+            fields (List[str], optional): Only analyze these fields
         context: Execution context
         
     Returns:
@@ -261,46 +308,79 @@ def data_analysis(params: Dict[str, Any], context: Optional[Dict[str, Any]] = No
         
     analysis_type = params.get('analysis_type', 'descriptive')
     
+    # Field selection is checked once per field, so keep it as a set
+    fields = params.get('fields')
+    if fields is not None:
+        if not isinstance(fields, list):
+            raise ValueError("Fields must be a list")
+        fields = frozenset(fields)
+    
     # Handle different analysis types
     if analysis_type == 'descriptive':
-        return _descriptive_analysis(data)
+        return _descriptive_analysis(data, fields)
     elif analysis_type == 'exploratory':
-        return _exploratory_analysis(data)
+        return _exploratory_analysis(data, fields)
     else:
         raise ValueError(f"Unsupported analysis type: {analysis_type}")
 
-def _descriptive_analysis(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Basic descriptive statistics for tabular data"""
+# Field type for each plain value type, so most values are classified with one lookup
+_FIELD_TYPES = {
+    bool: "boolean",
+    int: "numeric",
+    float: "numeric",
+    str: "string",
+    list: "complex",
+    dict: "complex"
+}
+
+def _field_type(value: Any) -> str:
+    """Classify a value as numeric, string, boolean, complex or unknown"""
+    field_type = _FIELD_TYPES.get(type(value))
+    if field_type is not None:
+        return field_type
+    
+    # Subclasses fall back to isinstance checks; bool is tested first since it subclasses int
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "numeric"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (list, dict)):
+        return "complex"
+    return "unknown"
+
+def _descriptive_analysis(data: List[Dict[str, Any]], fields: Optional[frozenset] = None) -> Dict[str, Any]:
+    """Basic descriptive statistics for tabular data, optionally limited to some fields"""
     if not data or len(data) == 0:
         return {"error": "Empty dataset"}
     
-    # Get all numeric fields
+    # Get all numeric fields (booleans are not numbers here, even though bool subclasses int)
     first_item = data[0]
     numeric_fields = [
         field for field, value in first_item.items()
-        if isinstance(value, (int, float))
+        if _field_type(value) == "numeric" and (fields is None or field in fields)
     ]
     
     # Calculate statistics for each numeric field
     stats = {}
     for field in numeric_fields:
-        values = [item.get(field) for item in data if item.get(field) is not None]
+        values = [value for value in (item.get(field) for item in data) if value is not None]
         if values:
+            # One in-place sort yields min, max and median without further passes
+            values.sort()
+            count = len(values)
+            total = sum(values)
+            mid = count // 2
             stats[field] = {
-                "count": len(values),
-                "min": min(values),
-                "max": max(values),
-                "mean": sum(values) / len(values),
-                "sum": sum(values)
+                "count": count,
+                "missing": len(data) - count,  # Derived from the count, no extra pass
+                "min": values[0],
+                "max": values[-1],
+                "mean": total / count,
+                "sum": total,
+                "median": (values[mid-1] + values[mid]) / 2 if count % 2 == 0 else values[mid]
             }
-            
-            # Calculate median
-            sorted_values = sorted(values)
-            mid = len(sorted_values) // 2
-            if len(sorted_values) % 2 == 0:
-                stats[field]["median"] = (sorted_values[mid-1] + sorted_values[mid]) / 2
-            else:
-                stats[field]["median"] = sorted_values[mid]
     
     return {
         "type": "descriptive",
@@ -309,82 +389,73 @@ def _descriptive_analysis(data: List[Dict[str, Any]]) -> Dict[str, Any]:
         "statistics": stats
     }
 
-def _exploratory_analysis(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """More detailed exploratory analysis"""
+def _exploratory_analysis(data: List[Dict[str, Any]], fields: Optional[frozenset] = None) -> Dict[str, Any]:
+    """More detailed exploratory analysis, optionally limited to some fields"""
     # First get basic descriptive statistics
-    base_stats = _descriptive_analysis(data)
+    base_stats = _descriptive_analysis(data, fields)
     
     if "error" in base_stats:
         return base_stats
     
     # Identify field types
     first_item = data[0]
-    field_types = {}
-    for field, value in first_item.items():
-        if isinstance(value, (int, float)):
-            field_types[field] = "numeric"
-        elif isinstance(value, str):
-            field_types[field] = "string"
-        elif isinstance(value, bool):
-            field_types[field] = "boolean"
-        elif isinstance(value, (list, dict)):
-            field_types[field] = "complex"
-        else:
-            field_types[field] = "unknown"
-    
-    # Category analysis for string fields
-    category_stats = {}
-    for field, field_type in field_types.items():
-        if field_type == "string":
-            value_counts = {}
-            for item in data:
-                value = item.get(field)
-                if value is not None:
-                    value_counts[value] = value_counts.get(value, 0) + 1
-            
-            top_categories = sorted(
-                [(value, count) for value, count in value_counts.items()],
-                key=lambda x: x[1],
-                reverse=True
-            )[:5]  # Get top 5
-            
-            category_stats[field] = {
-                "unique_values": len(value_counts),
-                "top_categories": dict(top_categories)
-            }
+    field_types = {
+        field: _field_type(value)
+        for field, value in first_item.items()
+        if fields is None or field in fields
+    }
+    
+    # Category analysis for string fields, counting every field in one pass over the data
+    string_fields = [field for field, field_type in field_types.items() if field_type == "string"]
+    value_counts = {field: Counter() for field in string_fields}
+    for item in data:
+        for field in string_fields:
+            value = item.get(field)
+            if value is not None:
+                value_counts[field][value] += 1
+    
+    category_stats = {
+        field: {
+            "unique_values": len(counts),
+            "top_categories": dict(counts.most_common(5))  # Get top 5
+        }
+        for field, counts in value_counts.items()
+    }
     
     # Find correlations between numeric fields
     correlations = {}
     numeric_fields = base_stats.get("numeric_fields", [])
     
     if len(numeric_fields) > 1:
+        # Extract each field's column once and reuse it for every pair it appears in
+        columns = {field: [item.get(field) for item in data] for field in numeric_fields}
+        
         # Basic correlation calculation
         for i, field1 in enumerate(numeric_fields):
+            column1 = columns[field1]
             for field2 in numeric_fields[i+1:]:
                 # Extract paired values (both non-None)
                 pairs = [
-                    (item.get(field1), item.get(field2))
-                    for item in data
-                    if item.get(field1) is not None and item.get(field2) is not None
+                    (x, y) for x, y in zip(column1, columns[field2])
+                    if x is not None and y is not None
                 ]
                 
-                if len(pairs) > 1:
-                    # Calculate covariance and correlation
-                    x_values = [x for x, y in pairs]
-                    y_values = [y for x, y in pairs]
-                    
-                    x_mean = sum(x_values) / len(x_values)
-                    y_mean = sum(y_values) / len(y_values)
-                    
-                    # Covariance
-                    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(x_values, y_values)) / len(pairs)
+                n = len(pairs)
+                if n > 1:
+                    x_mean = sum(x for x, _ in pairs) / n
+                    y_mean = sum(y for _, y in pairs) / n
                     
-                    # Standard deviations
-                    x_std = (sum((x - x_mean) ** 2 for x in x_values) / len(x_values)) ** 0.5
-                    y_std = (sum((y - y_mean) ** 2 for y in y_values) / len(y_values)) ** 0.5
+                    # Accumulate the co-deviation and both squared deviations in one pass
+                    sxy = sxx = syy = 0.0
+                    for x, y in pairs:
+                        dx = x - x_mean
+                        dy = y - y_mean
+                        sxy += dx * dy
+                        sxx += dx * dx
+                        syy += dy * dy
                     
-                    # Correlation coefficient
-                    correlation = covariance / (x_std * y_std) if x_std > 0 and y_std > 0 else 0
+                    # Correlation coefficient (the 1/n factors of covariance and deviations cancel)
+                    correlation = sxy / (sxx * syy) ** 0.5 if sxx > 0 and syy > 0 else 0
                     
                     correlations[f"{field1}:{field2}"] = round(correlation, 3)
     
@@ -395,6 +466,90 @@ def _exploratory_analysis(data: List[Dict[str, Any]]) -> Dict[str, Any]:
         "correlations": correlations
     }
 
+# Resource caps for code_execution processes
+_CODE_TIMEOUT = 10  # Seconds of wall time, and the most a caller may ask for
+_CODE_CPU_LIMIT = 10  # Seconds of CPU time
+_CODE_MEMORY_LIMIT = 512  # Megabytes
+_CODE_FILE_LIMIT = 16  # Megabytes a Python snippet may write to any file, including its output
+_CODE_OUTPUT_LIMIT = 64 * 1024  # Characters of stdout/stderr returned to the caller
+
+# Runs a Python snippet after capping its CPU time and address space. The limits are
+# applied inside the child rather than through preexec_fn, which is unsafe to use
+# while tools run on worker threads. The source is read from stdin, compiled and
+# executed directly rather than through runpy, keeping startup and tracebacks lean.
+_PYTHON_BOOTSTRAP = f"""
+import sys
+try:
+    import resource
+except ImportError:
+    pass
+else:
+    for limit, value in (
+        (resource.RLIMIT_CPU, {_CODE_CPU_LIMIT}),
+        (resource.RLIMIT_AS, {_CODE_MEMORY_LIMIT << 20}),
+        (resource.RLIMIT_FSIZE, {_CODE_FILE_LIMIT << 20})
+    ):
+        hard = resource.getrlimit(limit)[1]
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(limit, (value, hard))
+import linecache, traceback
+source = sys.stdin.buffer.read()
+# Make the snippet's lines available to tracebacks
+linecache.cache['<snippet>'] = (len(source), None, source.decode('utf-8', 'replace').splitlines(True), '<snippet>')
+sys.argv = ['<snippet>']
+try:
+    exec(compile(source, '<snippet>', 'exec'), {{'__name__': '__main__', '__builtins__': __builtins__}})
+except SystemExit:
+    raise
+except BaseException as e:
+    # Report the error from the snippet's own frames
+    traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+    sys.exit(1)
+"""
+
+# Interpreter command for each supported code_execution language; the code is read from stdin
+_CODE_RUNNERS = {
+    # -I skips user site-packages and PYTHON* variables, trimming interpreter startup
+    'python': ('python', '-I', '-c', _PYTHON_BOOTSTRAP),
+    'javascript': ('node', f'--max-old-space-size={_CODE_MEMORY_LIMIT}', '-')
+}
+
+# Environment for code_execution processes, built once at import. Only what the
+# interpreters need is passed through, so API keys in the server's environment
+# are not visible to executed code.
+_SANDBOX_ENV = {
+    name: os.environ[name]
+    for name in ('PATH', 'LANG', 'LC_ALL', 'SYSTEMROOT', 'TMPDIR', 'TEMP', 'TMP')
+    if name in os.environ
+}
+_SANDBOX_ENV['PYTHONDONTWRITEBYTECODE'] = '1'
+
+@functools.lru_cache(maxsize=None)
+def _resolve_interpreter(name: str) -> Optional[str]:
+    """Find an interpreter on PATH once and remember the result"""
+    return shutil.which(name)
+
+def _read_output(stream) -> str:
+    """Read a code_execution output file, keeping at most _CODE_OUTPUT_LIMIT characters"""
+    stream.seek(0)
+    output = stream.read(_CODE_OUTPUT_LIMIT + 1).decode('utf-8', errors='replace')
+    if len(output) > _CODE_OUTPUT_LIMIT:
+        output = output[:_CODE_OUTPUT_LIMIT] + "\n[output truncated]"
+    return output
+
+@functools.lru_cache(maxsize=256)
+def _python_syntax_error(code: str) -> Optional[str]:
+    """Parse Python code in-process and describe its syntax error, if any (cached per snippet)"""
+    try:
+        ast.parse(code)
+    except (SyntaxError, ValueError) as e:
+        return f"{type(e).__name__}: {e}"
+    except (RecursionError, MemoryError):
+        # Leave pathological inputs to the sandboxed interpreter
+        pass
+    return None
+
 def code_execution(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Execute code in a secure sandbox environment
@@ -403,6 +558,7 @@ def code_execution(params: Dict[str, Any], context: Optional[Dict[str, Any]] = N
         params:
             language (str): Programming language ('python' or 'javascript')
             code (str): Code to execute
+            timeout (float, optional): Seconds to allow, greater than 0 and at most 10 (default 10)
         context: Execution context
         
     Returns:
@@ -417,9 +573,19 @@ def code_execution(params: Dict[str, Any], context: Optional[Dict[str, Any]] = N
     if not code:
         raise ValueError("Code parameter is required")
         
-    if language not in ['python', 'javascript']:
+    runner = _CODE_RUNNERS.get(language)
+    if runner is None:
         raise ValueError("Unsupported language. Supported languages: python, javascript")
     
+    timeout = params.get('timeout')
+    if timeout is None:
+        timeout = _CODE_TIMEOUT
+    else:
+        timeout = float(timeout)
+        if not timeout > 0:
+            raise ValueError("Timeout must be a positive number of seconds")
+        timeout = min(timeout, _CODE_TIMEOUT)
+    
     # In a production environment, this should use a secure sandbox
     # For MVP, we'll use restricted execution with timeouts
     
@@ -429,8 +595,8 @@ def code_execution(params: Dict[str, Any], context: Optional[Dict[str, Any]] = N
     
     if use_mock:
         # Mock implementation
-        logger.info(f"[MOCK] Code execution - Language: {language}")
-        logger.info(f"[MOCK] Code: {code}")
+        logger.info("[MOCK] Code execution - Language: %s", language)
+        logger.info("[MOCK] Code: %s", code)
         time.sleep(1)  # Simulate execution time
         
         return {
@@ -448,100 +614,68 @@ def code_execution(params: Dict[str, Any], context: Optional[Dict[str, Any]] = N
             "error": "Execution disabled"
         }
         
-    else:
-        # Real implementation with security restrictions
-        try:
-            if language == 'python':
-                # Execute Python code with severe restrictions
-                import subprocess
-                import tempfile
-                
-                # Create temporary file for code
-                with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as temp:
-                    temp_filename = temp.name
-                    temp.write(code)
-                
-                try:
-                    # Execute with timeout and restricted permissions
-                    result = subprocess.run(
-                        ['python', temp_filename],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,  # 10 second timeout
-                        check=False
-                    )
-                    
-                    output = result.stdout
-                    error = result.stderr
-                    success = result.returncode == 0
-                    
-                    return {
-                        "language": language,
-                        "output": output,
-                        "error": error if error else None,
-                        "success": success
-                    }
-                    
-                finally:
-                    # Clean up temp file
-                    try:
-                        os.unlink(temp_filename)
-                    except Exception:
-                        pass
-                        
-            elif language == 'javascript':
-                # Execute JavaScript using Node.js
-                import subprocess
-                import tempfile
-                
-                # Create temporary file for code
-                with tempfile.NamedTemporaryFile(suffix='.js', mode='w', delete=False) as temp:
-                    temp_filename = temp.name
-                    temp.write(code)
-                
-                try:
-                    # Execute with timeout and restricted permissions
-                    result = subprocess.run(
-                        ['node', temp_filename],
-                        capture_output=True,
-                        text=True,
-                        timeout=10,  # 10 second timeout
-                        check=False
-                    )
-                    
-                    output = result.stdout
-                    error = result.stderr
-                    success = result.returncode == 0
-                    
-                    return {
-                        "language": language,
-                        "output": output,
-                        "error": error if error else None,
-                        "success": success
-                    }
-                    
-                finally:
-                    # Clean up temp file
-                    try:
-                        os.unlink(temp_filename)
-                    except Exception:
-                        pass
-                        
-        except subprocess.TimeoutExpired:
-            return {
-                "language": language,
-                "output": "Execution timed out after 10 seconds",
-                "error": "Timeout",
-                "success": False
-            }
-        except Exception as e:
-            logger.exception(f"Error in code execution: {str(e)}")
+    # Reject Python that doesn't parse without paying for an interpreter start
+    if language == 'python':
+        syntax_error = _python_syntax_error(code)
+        if syntax_error:
             return {
                 "language": language,
                 "output": "",
-                "error": str(e),
+                "error": syntax_error,
                 "success": False
             }
+    
+    # Real implementation with security restrictions
+    interpreter = _resolve_interpreter(runner[0])
+    if interpreter is None:
+        return {
+            "language": language,
+            "output": "",
+            "error": f"Interpreter '{runner[0]}' is not installed",
+            "success": False
+        }
+    
+    try:
+        # Output goes to temporary files rather than pipes so a runaway snippet
+        # can't grow it in memory; only the first _CODE_OUTPUT_LIMIT characters are read
+        with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+            # Execute with timeout and restricted permissions, passing the code on stdin
+            result = subprocess.run(
+                [interpreter, *runner[1:]],
+                input=code.encode('utf-8'),
+                stdout=stdout,
+                stderr=stderr,
+                timeout=timeout,
+                check=False,
+                env=_SANDBOX_ENV
+            )
+            
+            output = _read_output(stdout)
+            error = _read_output(stderr)
+        success = result.returncode == 0
+        
+        return {
+            "language": language,
+            "output": output,
+            "error": error if error else None,
+            "success": success
+        }
+        
+    except subprocess.TimeoutExpired:
+        return {
+            "language": language,
+            "output": f"Execution timed out after {timeout:g} seconds",
+            "error": "Timeout",
+            "success": False
+        }
+    except Exception as e:
+        logger.exception("Error in code execution: %s", e)
+        return {
+            "language": language,
+            "output": "",
+            "error": str(e),
+            "success": False
+        }
 
 def translation(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -569,9 +703,13 @@ def translation(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None
     
     # Mock implementation for development/testing
     use_mock = os.environ.get('USE_MOCK_TOOLS', 'false').lower() == 'true'
+    translation_api_key = os.environ.get('TRANSLATION_API_KEY')
     
-    if use_mock:
-        logger.info(f"[MOCK] Translation - Text: {text[:50]}..., Source: {source_language}, Target: {target_language}")
+    if not use_mock and not translation_api_key:
+        logger.warning("No translation API key configured, using mock response")
+    
+    if use_mock or not translation_api_key:
+        logger.info("[MOCK] Translation - Text: %s..., Source: %s, Target: %s", text[:50], source_language, target_language)
         time.sleep(1)  # Simulate API delay
         
         # Simple mock translation (just adds language code as prefix)
@@ -589,23 +727,15 @@ def translation(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None
         # Real implementation using translation API
         try:
             # Example using a generic translation API (replace with your preferred provider)
-            translation_api_key = os.environ.get('TRANSLATION_API_KEY')
-            if not translation_api_key:
-                logger.warning("No translation API key configured, using mock response")
-                return translation(params, context)
-                
             api_url = "https://api.translation-provider.com/translate"
-            headers = {
-                "Authorization": f"Bearer {translation_api_key}",
-                "Content-Type": "application/json"
-            }
+            headers = _api_headers(translation_api_key)
             payload = {
                 "text": text,
                 "source": source_language,
                 "target": target_language
             }
             
-            response = requests.post(api_url, headers=headers, json=payload)
+            response = _get_http_session().post(api_url, headers=headers, json=payload)
             response.raise_for_status()
             
             # Parse response (adjust based on actual API response format)
@@ -619,7 +749,7 @@ def translation(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None
             }
             
         except Exception as e:
-            logger.exception(f"Error in translation: {str(e)}")
+            logger.exception("Error in translation: %s", e)
             raise ValueError(f"Translation failed: {str(e)}")
 
 def image_generation(params: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -648,7 +778,7 @@ def image_generation(params: Dict[str, Any], context: Optional[Dict[str, Any]] =
     image_api_key = os.environ.get('IMAGE_API_KEY')
     
     if use_mock or not image_api_key:
-        logger.info(f"[MOCK] Image generation - Prompt: {prompt}, Style: {style}")
+        logger.info("[MOCK] Image generation - Prompt: %s, Style: %s", prompt, style)
         time.sleep(2)  # Simulate API delay
         
         # Return a placeholder image URL
@@ -665,17 +795,14 @@ def image_generation(params: Dict[str, Any], context: Optional[Dict[str, Any]] =
         try:
             # Example using a generic image API (replace with your preferred provider)
             api_url = "https://api.image-provider.com/generate"
-            headers = {
-                "Authorization": f"Bearer {image_api_key}",
-                "Content-Type": "application/json"
-            }
+            headers = _api_headers(image_api_key)
             payload = {
                 "prompt": prompt,
                 "style": style,
                 "size": size
             }
             
-            response = requests.post(api_url, headers=headers, json=payload)
+            response = _get_http_session().post(api_url, headers=headers, json=payload)
             response.raise_for_status()
             
             # Parse response (adjust based on actual API response format)
@@ -690,5 +817,5 @@ def image_generation(params: Dict[str, Any], context: Optional[Dict[str, Any]] =
             }
             
         except Exception as e:
-            logger.exception(f"Error in image generation: {str(e)}")
+            logger.exception("Error in image generation: %s", e)
             raise ValueError(f"Image generation failed: {str(e)}")